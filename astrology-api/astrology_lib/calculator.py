@@ -2,20 +2,27 @@
 AstrologyCalculator - Main class for calculating astrological charts.
 """
 
+import asyncio
 import logging
-from typing import Optional, Union, List, Dict, Any
-from datetime import datetime
+import uuid
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from threading import RLock
+from typing import Optional, Union, List, Dict, Any, Tuple, Callable, Sequence, TYPE_CHECKING, Literal, TypedDict, Required, cast
+from datetime import datetime, timezone
 
+from pydantic import BaseModel
 from kerykeion import (
     AstrologicalSubject,
-    KerykeionChartSVG,
     SynastryAspects,
     NatalAspects,
     RelationshipScoreFactory,
     CompositeSubjectFactory,
 )
 from kerykeion.settings.config_constants import DEFAULT_ACTIVE_POINTS, DEFAULT_ACTIVE_ASPECTS
-from kerykeion.kr_types.kr_models import ActiveAspect
+from kerykeion.kr_types.kr_models import ActiveAspect, CompositeSubjectModel
 from kerykeion.kr_types.kr_literals import (
     KerykeionChartTheme,
     KerykeionChartLanguage,
@@ -23,8 +30,13 @@ from kerykeion.kr_types.kr_literals import (
     AxialCusps,
 )
 
-from .types.request_models import SubjectModel, TransitSubjectModel
-from .utils.get_time_from_google import get_time_from_google
+from .types.request_models import AbstractBaseSubjectModel, SubjectModel, TransitSubjectModel
+from .utils.time_sync import OffsetClock
+from .chart_svg import ChartSVG
+from .utils.dump_json import dump_json
+
+if TYPE_CHECKING:
+    import httpx
 
 logger = logging.getLogger(__name__)
 
@@ -36,18 +48,309 @@ GEONAMES_ERROR_MESSAGE = (
     "Note: The nation field should be the country code (e.g. US, UK, FR, DE, etc.)."
 )
 
+SUBJECT_CACHE_SIZE = 1024
+GEONAMES_CACHE_SIZE = 4096
+SVG_STORE_SIZE = 512
+
+GEONAMES_SEARCH_URL = "http://api.geonames.org/searchJSON"
+GEONAMES_TIMEOUT = 10.0
+
+# NatalAspects kept on each cached subject, one per set of active points and aspects
+NATAL_ASPECTS_CACHE_SIZE = 8
+_NATAL_ASPECTS_LOCK = RLock()
+
+# Guards the composite subjects kept on each cached subject
+_COMPOSITE_LOCK = RLock()
+
+# Frozen copies of Kerykeion's defaults, shared by every call that does not set its own
+_DEFAULT_POINTS_TUPLE: Tuple[Union[Planet, AxialCusps], ...] = tuple(DEFAULT_ACTIVE_POINTS)
+_DEFAULT_ASPECTS_TUPLE: Tuple[ActiveAspect, ...] = tuple(DEFAULT_ACTIVE_ASPECTS)
+
+# (city, nation) -> (resolved nation, latitude, longitude, timezone) from previous GeoNames lookups
+_GEO_CACHE: "OrderedDict[Tuple[str, Optional[str]], Tuple[str, float, float, str]]" = OrderedDict()
+_GEO_CACHE_LOCK = RLock()
+
+# Rendered SVGs and dumped aspects of the last charts, keyed by chart type, subjects and options.
+# Cached subjects are shared between calls, so identical chart requests reuse the whole render.
+CHART_CACHE_SIZE = 64
+_CHART_CACHE: "OrderedDict[tuple, Tuple[ChartSVGs, Tuple[Dict[str, Any], ...]]]" = OrderedDict()
+_CHART_CACHE_LOCK = RLock()
+
+# An AsyncClient is bound to the event loop it first runs on, so each running loop gets its own
+_GEONAMES_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+# Local clock corrected against NTP, used for the current-time data
+_CLOCK = OffsetClock()
+
+# pyswisseph holds the GIL, so offline subject builds do not gain from threads. Only the
+# GeoNames request of a subject with an uncached location overlaps with the other build.
+_SUBJECT_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="astrology-subject")
+
+ChartRender = Literal["full", "wheel", "both"]
+
+
+class ChartSVGs(TypedDict, total=False):
+    """
+    The rendered charts: either the SVGs (chart, wheel_chart) or their ids (chart_id, wheel_chart_id).
+    """
+
+    chart: str
+    wheel_chart: str
+    chart_id: str
+    wheel_chart_id: str
+
+
+class ChartResponse(ChartSVGs):
+    """
+    The dict returned by the calculate_*_chart methods.
+    """
+
+    status: Required[str]
+    data: Required[Dict[str, Any]]
+    aspects: Required[List[Dict[str, Any]]]
+
+
+def _submit_subject_build(concurrent: bool, fn: Callable[..., AstrologicalSubject], *args: Any, **kwargs: Any) -> "Future[AstrologicalSubject]":
+    """
+    Run a subject constructor on the subject pool, or inline when concurrent is False.
+    Swiss Ephemeris keeps the topocentric position and the sidereal mode as global state,
+    so subjects that set different values must not be built at the same time.
+    """
+    if concurrent:
+        return _SUBJECT_POOL.submit(fn, *args, **kwargs)
+
+    future: "Future[AstrologicalSubject]" = Future()
+    try:
+        future.set_result(fn(*args, **kwargs))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def _active_points_or_default(active_points: Optional[Sequence[Union[Planet, AxialCusps]]]) -> Sequence[Union[Planet, AxialCusps]]:
+    """
+    Return the given active points, or the frozen default ones when none are set.
+    """
+    return active_points or _DEFAULT_POINTS_TUPLE
+
+
+def _active_aspects_or_default(active_aspects: Optional[Sequence[ActiveAspect]]) -> Sequence[ActiveAspect]:
+    """
+    Return the given active aspects, or the frozen default ones when none are set.
+    """
+    return active_aspects or _DEFAULT_ASPECTS_TUPLE
+
+
+def _aspects_key(
+    active_points: Optional[Sequence[Union[Planet, AxialCusps]]],
+    active_aspects: Optional[Sequence[ActiveAspect]],
+) -> tuple:
+    """
+    Return a hashable key for a set of active points and aspects, the defaults included.
+    """
+    return (
+        tuple(_active_points_or_default(active_points)),
+        tuple((aspect["name"], aspect["orb"]) for aspect in _active_aspects_or_default(active_aspects)),
+    )
+
+
+def _get_cached_location(city: str, nation: Optional[str]) -> Optional[Tuple[str, float, float, str]]:
+    """
+    Return the location resolved by a previous GeoNames lookup, if any.
+    """
+    with _GEO_CACHE_LOCK:
+        location = _GEO_CACHE.get((city, nation))
+        if location is not None:
+            _GEO_CACHE.move_to_end((city, nation))
+        return location
+
+
+def _cache_location(city: str, nation: Optional[str], location: Tuple[str, float, float, str]) -> None:
+    """
+    Store the (nation, latitude, longitude, timezone) resolved by GeoNames for a city.
+    """
+    with _GEO_CACHE_LOCK:
+        _GEO_CACHE[(city, nation)] = location
+        _GEO_CACHE.move_to_end((city, nation))
+        while len(_GEO_CACHE) > GEONAMES_CACHE_SIZE:
+            _GEO_CACHE.popitem(last=False)
+
+
+def _geonames_lookup_pending(*subjects: AbstractBaseSubjectModel) -> bool:
+    """
+    Return True if building any of the subjects needs a GeoNames request.
+    """
+    return any(subject.geonames_username and _get_cached_location(subject.city, subject.nation) is None for subject in subjects)
+
+
+def _get_geonames_client() -> "httpx.AsyncClient":
+    """
+    Return the AsyncClient shared by the GeoNames lookups of the running event loop,
+    creating it on first use. Keeping one client per loop reuses its connections across lookups.
+    """
+    loop = asyncio.get_running_loop()
+    client = _GEONAMES_CLIENTS.get(loop)
+
+    if client is None or client.is_closed:
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError("httpx is required to resolve GeoNames locations asynchronously. Install it with: pip install httpx") from e
+
+        client = httpx.AsyncClient(
+            timeout=GEONAMES_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+        _GEONAMES_CLIENTS[loop] = client
+    return client
+
+
+def _minute_bucket(utc_datetime: datetime) -> int:
+    """
+    Return the number of whole minutes between the Unix epoch and a naive UTC datetime.
+    """
+    return int(utc_datetime.replace(tzinfo=timezone.utc).timestamp() // 60)
+
+
+@lru_cache(maxsize=1)
+def _current_time_subject(minute_bucket: int) -> AstrologicalSubject:
+    """
+    Build the AstrologicalSubject for the current moment, once per UTC minute.
+    """
+    utc_datetime = datetime.fromtimestamp(minute_bucket * 60, tz=timezone.utc)
+
+    return AstrologicalSubject(
+        city="GMT",
+        nation="UK",
+        lat=51.477928,
+        lng=-0.001545,
+        tz_str="GMT",
+        year=utc_datetime.year,
+        month=utc_datetime.month,
+        day=utc_datetime.day,
+        hour=utc_datetime.hour,
+        minute=utc_datetime.minute,
+        online=False,
+    )
+
+
+def _build_composite_subject(first_subject: AstrologicalSubject, second_subject: AstrologicalSubject) -> CompositeSubjectModel:
+    """
+    Build the midpoint composite subject of two AstrologicalSubjects.
+    The composite is stored on the first subject for as long as the second one is alive,
+    so a cached pair builds it once and it is freed with the subjects.
+    """
+    with _COMPOSITE_LOCK:
+        composites = getattr(first_subject, "_cached_composites", None)
+        if composites is None:
+            composites = weakref.WeakKeyDictionary()
+            first_subject._cached_composites = composites  # type: ignore
+        composite_subject = composites.get(second_subject)
+
+    if composite_subject is None:
+        composite_subject = CompositeSubjectFactory(first_subject, second_subject).get_midpoint_composite_subject_model()
+        with _COMPOSITE_LOCK:
+            composites[second_subject] = composite_subject
+    return composite_subject
+
+
+def _dump_aspects(aspects: List[BaseModel]) -> List[Dict[str, Any]]:
+    """
+    Serialize a list of aspect models.
+    Calls the pydantic-core serializer of each model directly, skipping the model_dump wrapper.
+    """
+    return [aspect.__pydantic_serializer__.to_python(aspect) for aspect in aspects]
+
+
+def _subject_key(subject: SubjectModel) -> tuple:
+    """
+    Build a hashable key from the SubjectModel fields that determine an AstrologicalSubject.
+    """
+    return (
+        subject.name,
+        subject.year,
+        subject.month,
+        subject.day,
+        subject.hour,
+        subject.minute,
+        subject.city,
+        subject.nation,
+        subject.latitude,
+        subject.longitude,
+        subject.timezone,
+        subject.zodiac_type,
+        subject.sidereal_mode,
+        subject.houses_system_identifier,
+        subject.perspective_type,
+    )
+
+
+@lru_cache(maxsize=SUBJECT_CACHE_SIZE)
+def _build_subject(key: tuple, geonames_username: Optional[str]) -> AstrologicalSubject:
+    """
+    Build an AstrologicalSubject from a key produced by _subject_key.
+    Cached, so identical subjects skip the Swiss Ephemeris computations.
+    """
+    (
+        name,
+        year,
+        month,
+        day,
+        hour,
+        minute,
+        city,
+        nation,
+        latitude,
+        longitude,
+        tz_str,
+        zodiac_type,
+        sidereal_mode,
+        houses_system_identifier,
+        perspective_type,
+    ) = key
+
+    return AstrologicalSubject(
+        name=name,
+        year=year,
+        month=month,
+        day=day,
+        hour=hour,
+        minute=minute,
+        city=city,
+        nation=nation,
+        lat=latitude,
+        lng=longitude,
+        tz_str=tz_str,
+        zodiac_type=zodiac_type,
+        sidereal_mode=sidereal_mode,
+        houses_system_identifier=houses_system_identifier,
+        perspective_type=perspective_type,
+        geonames_username=geonames_username,
+        online=True if geonames_username else False,
+    )
+
 
 class AstrologyCalculator:
     """
     Main calculator class for astrological chart calculations.
     """
 
+    def __init__(self) -> None:
+        # chart id -> SVG, for the charts returned by id (embed_chart=False), and SVG -> chart id.
+        # The SVGs are the strings held by the chart cache, so storing a cached chart copies nothing
+        self._svg_store: "OrderedDict[str, str]" = OrderedDict()
+        self._svg_ids: Dict[str, str] = {}
+        self._svg_store_lock = RLock()
+
     def _create_astrological_subject(
         self,
         subject: Union[SubjectModel, TransitSubjectModel],
     ) -> AstrologicalSubject:
         """
         Helper method to create an AstrologicalSubject from a SubjectModel.
+        Subjects are cached once their location is known. With a geonames_username,
+        the location resolved by the first lookup of a city is reused for later subjects;
+        their username is then not sent to GeoNames, so it is not checked.
         
         Args:
             subject: SubjectModel or TransitSubjectModel instance
@@ -59,30 +362,422 @@ class AstrologyCalculator:
             ValueError: If geonames lookup fails
         """
         try:
-            return AstrologicalSubject(
-                name=subject.name,
-                year=subject.year,
-                month=subject.month,
-                day=subject.day,
-                hour=subject.hour,
-                minute=subject.minute,
-                city=subject.city,
-                nation=subject.nation,
-                lat=subject.latitude,
-                lng=subject.longitude,
-                tz_str=subject.timezone,
-                zodiac_type=subject.zodiac_type,  # type: ignore
-                sidereal_mode=subject.sidereal_mode,
-                houses_system_identifier=subject.houses_system_identifier,  # type: ignore
-                perspective_type=subject.perspective_type,  # type: ignore
-                geonames_username=subject.geonames_username,
-                online=True if subject.geonames_username else False,
-            )
+            if subject.geonames_username:
+                location = _get_cached_location(subject.city, subject.nation)
+                if location is None:
+                    astrological_subject = _build_subject.__wrapped__(_subject_key(subject), subject.geonames_username)  # type: ignore
+                    _cache_location(
+                        subject.city,
+                        subject.nation,
+                        (astrological_subject.nation, astrological_subject.lat, astrological_subject.lng, astrological_subject.tz_str),
+                    )
+                    return astrological_subject
+
+                nation, latitude, longitude, tz_str = location
+                subject = subject.model_copy(
+                    update={
+                        "nation": nation,
+                        "latitude": latitude,
+                        "longitude": longitude,
+                        "timezone": tz_str,
+                        "geonames_username": None,
+                    }
+                )
+
+            return _build_subject(_subject_key(subject), None)  # type: ignore
         except Exception as e:
             if "data found for this city" in str(e):
                 raise ValueError(GEONAMES_ERROR_MESSAGE) from e
             raise
 
+    def _create_transit_subject(
+        self,
+        first_subject: SubjectModel,
+        transit_subject: TransitSubjectModel,
+    ) -> AstrologicalSubject:
+        """
+        Helper method to create the transit AstrologicalSubject of a natal subject.
+        The transit uses the zodiac, sidereal mode, houses system and perspective of the
+        natal subject, and is cached like any other subject.
+        
+        Args:
+            first_subject: SubjectModel for the natal chart
+            transit_subject: TransitSubjectModel for the transit time
+            
+        Returns:
+            AstrologicalSubject instance
+            
+        Raises:
+            ValueError: If geonames lookup fails
+        """
+        # Both models are already validated
+        subject = SubjectModel.model_construct(
+            **transit_subject.model_dump(),
+            name="Transit",
+            zodiac_type=first_subject.zodiac_type,
+            sidereal_mode=first_subject.sidereal_mode,
+            houses_system_identifier=first_subject.houses_system_identifier,
+            perspective_type=first_subject.perspective_type,
+        )
+        return self._create_astrological_subject(subject)
+
+    async def resolve_geonames(
+        self,
+        subject: AbstractBaseSubjectModel,
+        client: Optional["httpx.AsyncClient"] = None,
+    ) -> Tuple[str, float, float, str]:
+        """
+        Resolve the location of a subject with GeoNames without blocking the event loop.
+        The result is stored in the GeoNames cache, so calling this before any other method
+        lets the subject be built offline. Requires httpx.
+        
+        Args:
+            subject: SubjectModel or TransitSubjectModel with a geonames_username
+            client: AsyncClient to send the request with. Defaults to a client shared by the
+                lookups of the running event loop, closed with aclose_geonames_client
+            
+        Returns:
+            Tuple with the nation code, latitude, longitude and timezone
+            
+        Raises:
+            ValueError: If GeoNames finds no location or no geonames_username is set
+            httpx.HTTPError: If the request to GeoNames fails
+        """
+        if not subject.geonames_username:
+            raise ValueError("A geonames_username is required to resolve the location with GeoNames.")
+
+        location = _get_cached_location(subject.city, subject.nation)
+        if location is not None:
+            return location
+
+        logger.debug(f"Resolving GeoNames location for: {subject.city}, {subject.nation}")
+
+        params = {
+            "q": subject.city,
+            "country": subject.nation,
+            "username": subject.geonames_username,
+            "maxRows": 1,
+            "style": "FULL",
+            "featureClass": ["A", "P"],
+        }
+
+        response = await (client or _get_geonames_client()).get(GEONAMES_SEARCH_URL, params=params)
+        response.raise_for_status()
+        payload = response.json()
+
+        # An unknown username or city is answered with a status message and no geonames results
+        geonames = payload.get("geonames") if isinstance(payload, dict) else None
+        if not geonames:
+            raise ValueError(GEONAMES_ERROR_MESSAGE)
+
+        try:
+            city_data = geonames[0]
+            location = (
+                city_data["countryCode"],
+                float(city_data["lat"]),
+                float(city_data["lng"]),
+                city_data["timezone"]["timeZoneId"],
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(GEONAMES_ERROR_MESSAGE) from e
+
+        _cache_location(subject.city, subject.nation, location)
+        return location
+
+    async def aclose_geonames_client(self) -> None:
+        """
+        Close the AsyncClient used by resolve_geonames on the running event loop, if any.
+        """
+        client = _GEONAMES_CLIENTS.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def _create_two(
+        self,
+        first_subject: SubjectModel,
+        second_subject: SubjectModel,
+    ) -> Tuple[AstrologicalSubject, AstrologicalSubject]:
+        """
+        Create the AstrologicalSubjects for two subjects, concurrently when a GeoNames lookup is pending.
+        
+        Args:
+            first_subject: First SubjectModel
+            second_subject: Second SubjectModel
+            
+        Returns:
+            Tuple with the first and second AstrologicalSubject instances
+            
+        Raises:
+            ValueError: If geonames lookup fails
+        """
+        concurrent = (
+            _geonames_lookup_pending(first_subject, second_subject)
+            and "Topocentric" not in (first_subject.perspective_type, second_subject.perspective_type)
+            and first_subject.sidereal_mode == second_subject.sidereal_mode
+        )
+        first_future = _submit_subject_build(concurrent, self._create_astrological_subject, first_subject)
+        second_future = _submit_subject_build(concurrent, self._create_astrological_subject, second_subject)
+        return first_future.result(), second_future.result()
+
+    def _create_natal_and_transit(
+        self,
+        first_subject: SubjectModel,
+        transit_subject: TransitSubjectModel,
+    ) -> Tuple[AstrologicalSubject, AstrologicalSubject]:
+        """
+        Create the natal and transit AstrologicalSubjects, concurrently when a GeoNames lookup is pending.
+        
+        Args:
+            first_subject: SubjectModel for the natal chart
+            transit_subject: TransitSubjectModel for the transit time
+            
+        Returns:
+            Tuple with the natal and transit AstrologicalSubject instances
+            
+        Raises:
+            ValueError: If geonames lookup fails
+        """
+        # The transit subject shares the sidereal mode and perspective of the natal one
+        concurrent = _geonames_lookup_pending(first_subject, transit_subject) and first_subject.perspective_type != "Topocentric"
+        first_future = _submit_subject_build(concurrent, self._create_astrological_subject, first_subject)
+        second_future = _submit_subject_build(concurrent, self._create_transit_subject, first_subject, transit_subject)
+        return first_future.result(), second_future.result()
+
+    def _render_charts(
+        self,
+        kerykeion_chart: ChartSVG,
+        render: ChartRender,
+    ) -> ChartSVGs:
+        """
+        Render the requested SVGs from a single ChartSVG instance.
+        
+        Args:
+            kerykeion_chart: ChartSVG instance
+            render: Which SVG to render: "full", "wheel" or "both"
+            
+        Returns:
+            Dictionary with the chart SVG, plus the wheel_chart SVG when render is "both"
+        """
+        charts: ChartSVGs
+        if render == "wheel":
+            charts = {"chart": kerykeion_chart.makeWheelOnlyTemplate(minify=True)}
+        else:
+            charts = {"chart": kerykeion_chart.makeTemplate(minify=True)}
+            if render == "both":
+                charts["wheel_chart"] = kerykeion_chart.makeWheelOnlyTemplate(minify=True)
+        return charts
+
+    def _render_chart(
+        self,
+        key: tuple,
+        make_chart: Callable[[], ChartSVG],
+        wheel_only: Optional[bool] = False,
+        render: Optional[ChartRender] = None,
+        embed_chart: bool = True,
+    ) -> Tuple[ChartSVGs, List[Dict[str, Any]]]:
+        """
+        Render the requested SVGs and dump the aspects of a chart, reusing the result
+        of a previous call with the same key. The returned dicts and list are new on every call.
+        
+        Args:
+            key: Identifies the chart: its type, subjects, theme, language, active points and aspects
+            make_chart: Builds the ChartSVG instance when the chart is not cached
+            wheel_only: If True, only the zodiac wheel will be returned
+            render: Which SVG to render: "full", "wheel" or "both". Overrides wheel_only when set
+            embed_chart: If False, the SVGs are stored and their ids are returned instead
+            
+        Returns:
+            Tuple with the charts, as returned by _render_charts or by id, and the dumped aspects
+        """
+        if render is None:
+            render = "wheel" if wheel_only else "full"
+        key = key + (render,)
+
+        with _CHART_CACHE_LOCK:
+            rendered = _CHART_CACHE.get(key)
+            if rendered is not None:
+                _CHART_CACHE.move_to_end(key)
+
+        if rendered is None:
+            kerykeion_chart = make_chart()
+            rendered = (self._render_charts(kerykeion_chart, render), tuple(_dump_aspects(kerykeion_chart.aspects_list)))
+            with _CHART_CACHE_LOCK:
+                _CHART_CACHE[key] = rendered
+                while len(_CHART_CACHE) > CHART_CACHE_SIZE:
+                    _CHART_CACHE.popitem(last=False)
+
+        charts, aspects = rendered
+        if not embed_chart:
+            chart_ids: ChartSVGs = {"chart_id": self._store_svg(charts["chart"])}
+            if "wheel_chart" in charts:
+                chart_ids["wheel_chart_id"] = self._store_svg(charts["wheel_chart"])
+            charts = chart_ids
+        else:
+            charts = cast(ChartSVGs, dict(charts))
+        # The aspect dicts only hold scalars, so a shallow copy of each is enough
+        return charts, [dict(aspect) for aspect in aspects]
+
+    def _store_svg(self, svg: str) -> str:
+        """
+        Keep an SVG in the chart store and return its id.
+        The store holds the last SVG_STORE_SIZE charts. An SVG that is already stored,
+        such as a cached chart requested again, keeps its entry and its id.
+        """
+        with self._svg_store_lock:
+            chart_id = self._svg_ids.get(svg)
+            if chart_id is not None:
+                self._svg_store.move_to_end(chart_id)
+                return chart_id
+
+            chart_id = uuid.uuid4().hex
+            self._svg_ids[svg] = chart_id
+            self._svg_store[chart_id] = svg
+            while len(self._svg_store) > SVG_STORE_SIZE:
+                _, evicted_svg = self._svg_store.popitem(last=False)
+                del self._svg_ids[evicted_svg]
+        return chart_id
+
+    def get_chart_svg(self, chart_id: str) -> bytes:
+        """
+        Retrieve a chart SVG returned by id by a chart endpoint called with embed_chart False.
+        The bytes are UTF-8 encoded and can be sent as is with the image/svg+xml media type.
+        
+        Args:
+            chart_id: The chart_id or wheel_chart_id of a chart response
+            
+        Returns:
+            The SVG as bytes
+            
+        Raises:
+            ValueError: If the chart is unknown or has been evicted from the store
+        """
+        with self._svg_store_lock:
+            svg = self._svg_store.get(chart_id)
+            if svg is not None:
+                self._svg_store.move_to_end(chart_id)
+        if svg is None:
+            raise ValueError(f"Chart not found: {chart_id}")
+        return svg.encode("utf-8")
+
+    def _dump_subject(self, astrological_subject: AstrologicalSubject) -> Dict[str, Any]:
+        """
+        Serialize an AstrologicalSubject to a new dict.
+        The AstrologicalSubjectModel is stored on the instance, so cached subjects only build it once.
+        
+        Args:
+            astrological_subject: AstrologicalSubject instance
+            
+        Returns:
+            Dictionary with the subject data
+        """
+        model = getattr(astrological_subject, "_cached_model", None)
+        if model is None:
+            model = astrological_subject.model()
+            astrological_subject._cached_model = model  # type: ignore
+        return model.model_dump()
+
+    def _dump_data_json(self, astrological_subject: AstrologicalSubject) -> bytes:
+        """
+        Serialize the {"status", "data"} response of an AstrologicalSubject to JSON bytes.
+        The result is stored on the instance, so cached subjects are only encoded once.
+        
+        Args:
+            astrological_subject: AstrologicalSubject instance
+            
+        Returns:
+            The response as JSON bytes
+        """
+        data_json = getattr(astrological_subject, "_cached_data_json", None)
+        if data_json is None:
+            data_json = dump_json({"status": "OK", "data": self._dump_subject(astrological_subject)})
+            astrological_subject._cached_data_json = data_json  # type: ignore
+        return data_json
+
+    def _dump_composite_subject(self, composite_subject: CompositeSubjectModel) -> Dict[str, Any]:
+        """
+        Serialize a CompositeSubjectModel to a new dict, without the nested first and second subjects.
+        
+        Args:
+            composite_subject: CompositeSubjectModel instance
+            
+        Returns:
+            Dictionary with the composite subject data
+        """
+        return composite_subject.model_dump(exclude={"first_subject", "second_subject"})
+
+    def _compute_bundle(
+        self,
+        subject: SubjectModel,
+        active_points: Optional[List[Union[Planet, AxialCusps]]] = None,
+        active_aspects: Optional[List[ActiveAspect]] = None,
+    ) -> Tuple[AstrologicalSubject, Dict[str, Any], NatalAspects]:
+        """
+        Build the AstrologicalSubject, its serialized data and its natal aspects in one place,
+        so the birth data, natal aspects and birth chart methods share the same computation.
+        The aspects are only calculated when relevant_aspects is first accessed.
+        
+        Args:
+            subject: SubjectModel with birth information
+            active_points: List of active points to display
+            active_aspects: List of active aspects to display
+            
+        Returns:
+            Tuple with the AstrologicalSubject, its serialized data and the NatalAspects instance
+            
+        Raises:
+            ValueError: If geonames lookup fails
+        """
+        astrological_subject = self._create_astrological_subject(subject)
+        data = self._dump_subject(astrological_subject)
+        natal_aspects = self._get_natal_aspects(astrological_subject, active_points, active_aspects)
+        
+        return astrological_subject, data, natal_aspects
+
+    def _get_natal_aspects(
+        self,
+        astrological_subject: AstrologicalSubject,
+        active_points: Optional[List[Union[Planet, AxialCusps]]] = None,
+        active_aspects: Optional[List[ActiveAspect]] = None,
+    ) -> NatalAspects:
+        """
+        Get the NatalAspects of an AstrologicalSubject for the given active points and aspects.
+        The instances for the last NATAL_ASPECTS_CACHE_SIZE configurations are stored on the subject,
+        so cached subjects only calculate their aspects once per configuration.
+        
+        Args:
+            astrological_subject: AstrologicalSubject instance
+            active_points: List of active points to display
+            active_aspects: List of active aspects to display
+            
+        Returns:
+            NatalAspects instance
+        """
+        key = _aspects_key(active_points, active_aspects)
+        active_points = _active_points_or_default(active_points)  # type: ignore
+        active_aspects = _active_aspects_or_default(active_aspects)  # type: ignore
+
+        with _NATAL_ASPECTS_LOCK:
+            cached_aspects = getattr(astrological_subject, "_cached_natal_aspects", None)
+            if cached_aspects is None:
+                cached_aspects = OrderedDict()
+                astrological_subject._cached_natal_aspects = cached_aspects  # type: ignore
+
+            natal_aspects = cached_aspects.get(key)
+            if natal_aspects is not None:
+                cached_aspects.move_to_end(key)
+                return natal_aspects
+
+        natal_aspects = NatalAspects(
+            astrological_subject,
+            active_points=active_points,
+            active_aspects=active_aspects,
+        )
+        with _NATAL_ASPECTS_LOCK:
+            cached_aspects[key] = natal_aspects
+            while len(cached_aspects) > NATAL_ASPECTS_CACHE_SIZE:
+                cached_aspects.popitem(last=False)
+        return natal_aspects
+
     def get_birth_data(self, subject: SubjectModel) -> Dict[str, Any]:
         """
         Retrieve astrological data for a specific birth date.
@@ -100,23 +795,43 @@ class AstrologyCalculator:
         """
         logger.debug(f"Getting birth data for: {subject.name}")
         
-        astrological_subject = self._create_astrological_subject(subject)
-        data = astrological_subject.model().model_dump()
+        _, data, _ = self._compute_bundle(subject)
         
         return {
             "status": "OK",
             "data": data,
         }
 
+    def get_birth_data_json(self, subject: SubjectModel) -> bytes:
+        """
+        Same as get_birth_data, serialized to JSON bytes.
+        The bytes are stored with the cached subject, so identical subjects are only encoded once.
+        
+        Args:
+            subject: SubjectModel with birth information
+            
+        Returns:
+            The get_birth_data response as JSON bytes
+            
+        Raises:
+            ValueError: If geonames lookup fails or invalid input
+            Exception: For other calculation errors
+        """
+        logger.debug(f"Getting birth data as JSON for: {subject.name}")
+        
+        return self._dump_data_json(self._create_astrological_subject(subject))
+
     def calculate_birth_chart(
         self,
         subject: SubjectModel,
         theme: Optional[KerykeionChartTheme] = "classic",
         language: Optional[KerykeionChartLanguage] = "EN",
         wheel_only: Optional[bool] = False,
+        render: Optional[ChartRender] = None,
+        embed_chart: bool = True,
         active_points: Optional[List[Union[Planet, AxialCusps]]] = None,
         active_aspects: Optional[List[ActiveAspect]] = None,
-    ) -> Dict[str, Any]:
+    ) -> ChartResponse:
         """
         Retrieve an astrological birth chart for a specific birth date.
         Includes the data for the subject and the aspects.
@@ -126,11 +841,14 @@ class AstrologyCalculator:
             theme: Chart theme (classic, light, dark, dark-high-contrast)
             language: Chart language (EN, FR, PT, ES, TR, RU, IT, CN, DE, HI)
             wheel_only: If True, only the zodiac wheel will be returned
+            render: Which SVG to render: "full", "wheel" or "both". Overrides wheel_only when set
+            embed_chart: If False, the SVGs are kept in the chart store and only their ids are returned
             active_points: List of active points to display
             active_aspects: List of active aspects to display
             
         Returns:
-            Dictionary with status, chart SVG, data, and aspects
+            Dictionary with status, chart SVG (and wheel_chart SVG when render is "both"), data, and aspects.
+            With embed_chart False, chart_id (and wheel_chart_id) replace the SVGs
             
         Raises:
             ValueError: If geonames lookup fails or invalid input
@@ -138,27 +856,27 @@ class AstrologyCalculator:
         """
         logger.debug(f"Calculating birth chart for: {subject.name}")
         
-        astrological_subject = self._create_astrological_subject(subject)
-        data = astrological_subject.model().model_dump()
+        astrological_subject, data, _ = self._compute_bundle(subject, active_points, active_aspects)
         
-        kerykeion_chart = KerykeionChartSVG(
-            astrological_subject,
-            theme=theme,
-            chart_language=language or "EN",
-            active_points=active_points or DEFAULT_ACTIVE_POINTS,
-            active_aspects=active_aspects or DEFAULT_ACTIVE_ASPECTS,
+        charts, aspects = self._render_chart(
+            ("Natal", astrological_subject, theme, language or "EN", _aspects_key(active_points, active_aspects)),
+            lambda: ChartSVG(
+                astrological_subject,
+                theme=theme,
+                chart_language=language or "EN",
+                active_points=_active_points_or_default(active_points),  # type: ignore
+                active_aspects=_active_aspects_or_default(active_aspects),  # type: ignore
+            ),
+            wheel_only,
+            render,
+            embed_chart,
         )
         
-        if wheel_only:
-            svg = kerykeion_chart.makeWheelOnlyTemplate(minify=True)
-        else:
-            svg = kerykeion_chart.makeTemplate(minify=True)
-        
         return {
             "status": "OK",
-            "chart": svg,
+            **charts,
             "data": data,
-            "aspects": [aspect.model_dump() for aspect in kerykeion_chart.aspects_list],
+            "aspects": aspects,
         }
 
     def get_natal_aspects(
@@ -185,20 +903,64 @@ class AstrologyCalculator:
         """
         logger.debug(f"Getting natal aspects for: {subject.name}")
         
-        astrological_subject = self._create_astrological_subject(subject)
-        
-        aspects = NatalAspects(
-            astrological_subject,
-            active_points=active_points or DEFAULT_ACTIVE_POINTS,
-            active_aspects=active_aspects or DEFAULT_ACTIVE_ASPECTS,
-        ).relevant_aspects
+        _, data, natal_aspects = self._compute_bundle(subject, active_points, active_aspects)
         
         return {
             "status": "OK",
-            "data": {"subject": astrological_subject.model().model_dump()},
-            "aspects": [aspect.model_dump() for aspect in aspects],
+            "data": {"subject": data},
+            "aspects": _dump_aspects(natal_aspects.relevant_aspects),
         }
 
+    def calculate_birth_chart_with_aspects(
+        self,
+        subject: SubjectModel,
+        theme: Optional[KerykeionChartTheme] = "classic",
+        language: Optional[KerykeionChartLanguage] = "EN",
+        wheel_only: Optional[bool] = False,
+        render: Optional[ChartRender] = None,
+        embed_chart: bool = True,
+        active_points: Optional[List[Union[Planet, AxialCusps]]] = None,
+        active_aspects: Optional[List[ActiveAspect]] = None,
+    ) -> ChartResponse:
+        """
+        Retrieve the natal aspects, the data and the birth chart for a specific subject in one call.
+        The response has the same shape as get_natal_aspects, plus the chart. The subject,
+        the chart and the aspects are computed once.
+        
+        Args:
+            subject: SubjectModel with birth information
+            theme: Chart theme (classic, light, dark, dark-high-contrast)
+            language: Chart language (EN, FR, PT, ES, TR, RU, IT, CN, DE, HI)
+            wheel_only: If True, only the zodiac wheel will be returned
+            render: Which SVG to render: "full", "wheel" or "both". Overrides wheel_only when set
+            embed_chart: If False, the SVGs are kept in the chart store and only their ids are returned
+            active_points: List of active points to display
+            active_aspects: List of active aspects to display
+            
+        Returns:
+            Dictionary with status, chart SVG (and wheel_chart SVG when render is "both"), data, and aspects.
+            With embed_chart False, chart_id (and wheel_chart_id) replace the SVGs
+            
+        Raises:
+            ValueError: If geonames lookup fails or invalid input
+            Exception: For other calculation errors
+        """
+        logger.debug(f"Calculating birth chart with aspects for: {subject.name}")
+        
+        birth_chart = self.calculate_birth_chart(
+            subject,
+            theme=theme,
+            language=language,
+            wheel_only=wheel_only,
+            render=render,
+            embed_chart=embed_chart,
+            active_points=active_points,
+            active_aspects=active_aspects,
+        )
+        birth_chart["data"] = {"subject": birth_chart["data"]}
+        
+        return birth_chart
+
     def calculate_synastry_chart(
         self,
         first_subject: SubjectModel,
@@ -206,9 +968,11 @@ class AstrologyCalculator:
         theme: Optional[KerykeionChartTheme] = "classic",
         language: Optional[KerykeionChartLanguage] = "EN",
         wheel_only: Optional[bool] = False,
+        render: Optional[ChartRender] = None,
+        embed_chart: bool = True,
         active_points: Optional[List[Union[Planet, AxialCusps]]] = None,
         active_aspects: Optional[List[ActiveAspect]] = None,
-    ) -> Dict[str, Any]:
+    ) -> ChartResponse:
         """
         Retrieve a synastry chart between two subjects.
         Includes the data for the subjects and the aspects.
@@ -219,11 +983,14 @@ class AstrologyCalculator:
             theme: Chart theme
             language: Chart language
             wheel_only: If True, only the zodiac wheel will be returned
+            render: Which SVG to render: "full", "wheel" or "both". Overrides wheel_only when set
+            embed_chart: If False, the SVGs are kept in the chart store and only their ids are returned
             active_points: List of active points to display
             active_aspects: List of active aspects to display
             
         Returns:
-            Dictionary with status, chart SVG, data, and aspects
+            Dictionary with status, chart SVG (and wheel_chart SVG when render is "both"), data, and aspects.
+            With embed_chart False, chart_id (and wheel_chart_id) replace the SVGs
             
         Raises:
             ValueError: If geonames lookup fails or invalid input
@@ -231,31 +998,38 @@ class AstrologyCalculator:
         """
         logger.debug(f"Calculating synastry chart for: {first_subject.name} and {second_subject.name}")
         
-        first_astrological_subject = self._create_astrological_subject(first_subject)
-        second_astrological_subject = self._create_astrological_subject(second_subject)
+        first_astrological_subject, second_astrological_subject = self._create_two(first_subject, second_subject)
         
-        kerykeion_chart = KerykeionChartSVG(
-            first_astrological_subject,
-            second_obj=second_astrological_subject,
-            chart_type="Synastry",
-            theme=theme,
-            chart_language=language or "EN",
-            active_points=active_points or DEFAULT_ACTIVE_POINTS,
-            active_aspects=active_aspects or DEFAULT_ACTIVE_ASPECTS,
+        charts, aspects = self._render_chart(
+            (
+                "Synastry",
+                first_astrological_subject,
+                second_astrological_subject,
+                theme,
+                language or "EN",
+                _aspects_key(active_points, active_aspects),
+            ),
+            lambda: ChartSVG(
+                first_astrological_subject,
+                second_obj=second_astrological_subject,
+                chart_type="Synastry",
+                theme=theme,
+                chart_language=language or "EN",
+                active_points=_active_points_or_default(active_points),  # type: ignore
+                active_aspects=_active_aspects_or_default(active_aspects),  # type: ignore
+            ),
+            wheel_only,
+            render,
+            embed_chart,
         )
         
-        if wheel_only:
-            svg = kerykeion_chart.makeWheelOnlyTemplate(minify=True)
-        else:
-            svg = kerykeion_chart.makeTemplate(minify=True)
-        
         return {
             "status": "OK",
-            "chart": svg,
-            "aspects": [aspect.model_dump() for aspect in kerykeion_chart.aspects_list],
+            **charts,
+            "aspects": aspects,
             "data": {
-                "first_subject": first_astrological_subject.model().model_dump(),
-                "second_subject": second_astrological_subject.model().model_dump(),
+                "first_subject": self._dump_subject(first_astrological_subject),
+                "second_subject": self._dump_subject(second_astrological_subject),
             },
         }
 
@@ -285,23 +1059,22 @@ class AstrologyCalculator:
         """
         logger.debug(f"Getting synastry aspects for: {first_subject.name} and {second_subject.name}")
         
-        first_astrological_subject = self._create_astrological_subject(first_subject)
-        second_astrological_subject = self._create_astrological_subject(second_subject)
+        first_astrological_subject, second_astrological_subject = self._create_two(first_subject, second_subject)
         
         aspects = SynastryAspects(
             first_astrological_subject,
             second_astrological_subject,
-            active_points=active_points or DEFAULT_ACTIVE_POINTS,
-            active_aspects=active_aspects or DEFAULT_ACTIVE_ASPECTS,
+            active_points=_active_points_or_default(active_points),  # type: ignore
+            active_aspects=_active_aspects_or_default(active_aspects),  # type: ignore
         ).relevant_aspects
         
         return {
             "status": "OK",
             "data": {
-                "first_subject": first_astrological_subject.model().model_dump(),
-                "second_subject": second_astrological_subject.model().model_dump(),
+                "first_subject": self._dump_subject(first_astrological_subject),
+                "second_subject": self._dump_subject(second_astrological_subject),
             },
-            "aspects": [aspect.model_dump() for aspect in aspects],
+            "aspects": _dump_aspects(aspects),
         }
 
     def calculate_transit_chart(
@@ -311,9 +1084,11 @@ class AstrologyCalculator:
         theme: Optional[KerykeionChartTheme] = "classic",
         language: Optional[KerykeionChartLanguage] = "EN",
         wheel_only: Optional[bool] = False,
+        render: Optional[ChartRender] = None,
+        embed_chart: bool = True,
         active_points: Optional[List[Union[Planet, AxialCusps]]] = None,
         active_aspects: Optional[List[ActiveAspect]] = None,
-    ) -> Dict[str, Any]:
+    ) -> ChartResponse:
         """
         Retrieve a transit chart for a specific subject.
         Includes the data for the subject and the aspects.
@@ -324,11 +1099,14 @@ class AstrologyCalculator:
             theme: Chart theme
             language: Chart language
             wheel_only: If True, only the zodiac wheel will be returned
+            render: Which SVG to render: "full", "wheel" or "both". Overrides wheel_only when set
+            embed_chart: If False, the SVGs are kept in the chart store and only their ids are returned
             active_points: List of active points to display
             active_aspects: List of active aspects to display
             
         Returns:
-            Dictionary with status, chart SVG, data, and aspects
+            Dictionary with status, chart SVG (and wheel_chart SVG when render is "both"), data, and aspects.
+            With embed_chart False, chart_id (and wheel_chart_id) replace the SVGs
             
         Raises:
             ValueError: If geonames lookup fails or invalid input
@@ -336,50 +1114,38 @@ class AstrologyCalculator:
         """
         logger.debug(f"Calculating transit chart for: {first_subject.name}")
         
-        first_astrological_subject = self._create_astrological_subject(first_subject)
+        first_astrological_subject, second_astrological_subject = self._create_natal_and_transit(first_subject, transit_subject)
         
-        second_astrological_subject = AstrologicalSubject(
-            name="Transit",
-            year=transit_subject.year,
-            month=transit_subject.month,
-            day=transit_subject.day,
-            hour=transit_subject.hour,
-            minute=transit_subject.minute,
-            city=transit_subject.city,
-            nation=transit_subject.nation,
-            lat=transit_subject.latitude,
-            lng=transit_subject.longitude,
-            tz_str=transit_subject.timezone,
-            zodiac_type=first_astrological_subject.zodiac_type,  # type: ignore
-            sidereal_mode=first_subject.sidereal_mode,
-            houses_system_identifier=first_subject.houses_system_identifier,  # type: ignore
-            perspective_type=first_subject.perspective_type,  # type: ignore
-            geonames_username=transit_subject.geonames_username,
-            online=True if transit_subject.geonames_username else False,
+        charts, aspects = self._render_chart(
+            (
+                "Transit",
+                first_astrological_subject,
+                second_astrological_subject,
+                theme,
+                language or "EN",
+                _aspects_key(active_points, active_aspects),
+            ),
+            lambda: ChartSVG(
+                first_astrological_subject,
+                second_obj=second_astrological_subject,
+                chart_type="Transit",
+                theme=theme,
+                chart_language=language or "EN",
+                active_points=_active_points_or_default(active_points),  # type: ignore
+                active_aspects=_active_aspects_or_default(active_aspects),  # type: ignore
+            ),
+            wheel_only,
+            render,
+            embed_chart,
         )
         
-        kerykeion_chart = KerykeionChartSVG(
-            first_astrological_subject,
-            second_obj=second_astrological_subject,
-            chart_type="Transit",
-            theme=theme,
-            chart_language=language or "EN",
-            active_points=active_points or DEFAULT_ACTIVE_POINTS,
-            active_aspects=active_aspects or DEFAULT_ACTIVE_ASPECTS,
-        )
-        
-        if wheel_only:
-            svg = kerykeion_chart.makeWheelOnlyTemplate(minify=True)
-        else:
-            svg = kerykeion_chart.makeTemplate(minify=True)
-        
         return {
             "status": "OK",
-            "chart": svg,
-            "aspects": [aspect.model_dump() for aspect in kerykeion_chart.aspects_list],
+            **charts,
+            "aspects": aspects,
             "data": {
-                "subject": first_astrological_subject.model().model_dump(),
-                "transit": second_astrological_subject.model().model_dump(),
+                "subject": self._dump_subject(first_astrological_subject),
+                "transit": self._dump_subject(second_astrological_subject),
             },
         }
 
@@ -409,42 +1175,22 @@ class AstrologyCalculator:
         """
         logger.debug(f"Getting transit aspects for: {first_subject.name}")
         
-        first_astrological_subject = self._create_astrological_subject(first_subject)
-        
-        second_astrological_subject = AstrologicalSubject(
-            name="Transit",
-            year=transit_subject.year,
-            month=transit_subject.month,
-            day=transit_subject.day,
-            hour=transit_subject.hour,
-            minute=transit_subject.minute,
-            city=transit_subject.city,
-            nation=transit_subject.nation,
-            lat=transit_subject.latitude,
-            lng=transit_subject.longitude,
-            tz_str=transit_subject.timezone,
-            zodiac_type=first_astrological_subject.zodiac_type,  # type: ignore
-            sidereal_mode=first_subject.sidereal_mode,
-            houses_system_identifier=first_subject.houses_system_identifier,  # type: ignore
-            perspective_type=first_subject.perspective_type,  # type: ignore
-            geonames_username=transit_subject.geonames_username,
-            online=True if transit_subject.geonames_username else False,
-        )
+        first_astrological_subject, second_astrological_subject = self._create_natal_and_transit(first_subject, transit_subject)
         
         aspects = SynastryAspects(
             first_astrological_subject,
             second_astrological_subject,
-            active_points=active_points or DEFAULT_ACTIVE_POINTS,
-            active_aspects=active_aspects or DEFAULT_ACTIVE_ASPECTS,
+            active_points=_active_points_or_default(active_points),  # type: ignore
+            active_aspects=_active_aspects_or_default(active_aspects),  # type: ignore
         ).relevant_aspects
         
         return {
             "status": "OK",
             "data": {
-                "subject": first_astrological_subject.model().model_dump(),
-                "transit": second_astrological_subject.model().model_dump(),
+                "subject": self._dump_subject(first_astrological_subject),
+                "transit": self._dump_subject(second_astrological_subject),
             },
-            "aspects": [aspect.model_dump() for aspect in aspects],
+            "aspects": _dump_aspects(aspects),
         }
 
     def calculate_relationship_score(
@@ -477,8 +1223,7 @@ class AstrologyCalculator:
         """
         logger.debug(f"Calculating relationship score for: {first_subject.name} and {second_subject.name}")
         
-        first_astrological_subject = self._create_astrological_subject(first_subject)
-        second_astrological_subject = self._create_astrological_subject(second_subject)
+        first_astrological_subject, second_astrological_subject = self._create_two(first_subject, second_subject)
         
         score_factory = RelationshipScoreFactory(first_astrological_subject, second_astrological_subject)
         score_model = score_factory.get_relationship_score()
@@ -488,10 +1233,10 @@ class AstrologyCalculator:
             "score": score_model.score_value,
             "score_description": score_model.score_description,
             "is_destiny_sign": score_model.is_destiny_sign,
-            "aspects": [aspect.model_dump() for aspect in score_model.aspects],
+            "aspects": _dump_aspects(score_model.aspects),
             "data": {
-                "first_subject": first_astrological_subject.model().model_dump(),
-                "second_subject": second_astrological_subject.model().model_dump(),
+                "first_subject": self._dump_subject(first_astrological_subject),
+                "second_subject": self._dump_subject(second_astrological_subject),
             },
         }
 
@@ -502,9 +1247,11 @@ class AstrologyCalculator:
         theme: Optional[KerykeionChartTheme] = "classic",
         language: Optional[KerykeionChartLanguage] = "EN",
         wheel_only: Optional[bool] = False,
+        render: Optional[ChartRender] = None,
+        embed_chart: bool = True,
         active_points: Optional[List[Union[Planet, AxialCusps]]] = None,
         active_aspects: Optional[List[ActiveAspect]] = None,
-    ) -> Dict[str, Any]:
+    ) -> ChartResponse:
         """
         Retrieve a composite chart between two subjects.
         Includes the data for the subjects and the aspects.
@@ -516,11 +1263,14 @@ class AstrologyCalculator:
             theme: Chart theme
             language: Chart language
             wheel_only: If True, only the zodiac wheel will be returned
+            render: Which SVG to render: "full", "wheel" or "both". Overrides wheel_only when set
+            embed_chart: If False, the SVGs are kept in the chart store and only their ids are returned
             active_points: List of active points to display
             active_aspects: List of active aspects to display
             
         Returns:
-            Dictionary with status, chart SVG, data, and aspects
+            Dictionary with status, chart SVG (and wheel_chart SVG when render is "both"), data, and aspects.
+            With embed_chart False, chart_id (and wheel_chart_id) replace the SVGs
             
         Raises:
             ValueError: If geonames lookup fails or invalid input
@@ -528,36 +1278,32 @@ class AstrologyCalculator:
         """
         logger.debug(f"Calculating composite chart for: {first_subject.name} and {second_subject.name}")
         
-        first_astrological_subject = self._create_astrological_subject(first_subject)
-        second_astrological_subject = self._create_astrological_subject(second_subject)
+        first_astrological_subject, second_astrological_subject = self._create_two(first_subject, second_subject)
         
-        composite_factory = CompositeSubjectFactory(first_astrological_subject, second_astrological_subject)
-        composite_subject = composite_factory.get_midpoint_composite_subject_model()
+        composite_subject = _build_composite_subject(first_astrological_subject, second_astrological_subject)
         
-        kerykeion_chart = KerykeionChartSVG(
-            composite_subject,
-            chart_type="Composite",
-            theme=theme,
+        charts, aspects = self._render_chart(
+            ("Composite", first_astrological_subject, second_astrological_subject, theme),
+            lambda: ChartSVG(
+                composite_subject,
+                chart_type="Composite",
+                theme=theme,
+            ),
+            wheel_only,
+            render,
+            embed_chart,
         )
         
-        if wheel_only:
-            svg = kerykeion_chart.makeWheelOnlyTemplate(minify=True)
-        else:
-            svg = kerykeion_chart.makeTemplate(minify=True)
-        
-        composite_subject_dict = composite_subject.model_dump()
-        for key in ["first_subject", "second_subject"]:
-            if key in composite_subject_dict:
-                composite_subject_dict.pop(key)
+        composite_subject_dict = self._dump_composite_subject(composite_subject)
         
         return {
             "status": "OK",
-            "chart": svg,
-            "aspects": [aspect.model_dump() for aspect in kerykeion_chart.aspects_list],
+            **charts,
+            "aspects": aspects,
             "data": {
                 "composite_subject": composite_subject_dict,
-                "first_subject": first_astrological_subject.model().model_dump(),
-                "second_subject": second_astrological_subject.model().model_dump(),
+                "first_subject": self._dump_subject(first_astrological_subject),
+                "second_subject": self._dump_subject(second_astrological_subject),
             },
         }
 
@@ -587,81 +1333,81 @@ class AstrologyCalculator:
         """
         logger.debug(f"Getting composite aspects for: {first_subject.name} and {second_subject.name}")
         
-        first_astrological_subject = self._create_astrological_subject(first_subject)
-        second_astrological_subject = self._create_astrological_subject(second_subject)
+        first_astrological_subject, second_astrological_subject = self._create_two(first_subject, second_subject)
         
-        composite_factory = CompositeSubjectFactory(first_astrological_subject, second_astrological_subject)
-        composite_data = composite_factory.get_midpoint_composite_subject_model()
+        composite_data = _build_composite_subject(first_astrological_subject, second_astrological_subject)
         
         aspects = NatalAspects(
             composite_data,
-            active_points=active_points or DEFAULT_ACTIVE_POINTS,
-            active_aspects=active_aspects or DEFAULT_ACTIVE_ASPECTS,
+            active_points=_active_points_or_default(active_points),  # type: ignore
+            active_aspects=_active_aspects_or_default(active_aspects),  # type: ignore
         ).relevant_aspects
         
-        composite_subject_dict = composite_data.model_dump()
-        for key in ["first_subject", "second_subject"]:
-            if key in composite_subject_dict:
-                composite_subject_dict.pop(key)
+        composite_subject_dict = self._dump_composite_subject(composite_data)
         
         return {
             "status": "OK",
             "data": {
                 "composite_subject": composite_subject_dict,
-                "first_subject": first_astrological_subject.model().model_dump(),
-                "second_subject": second_astrological_subject.model().model_dump(),
+                "first_subject": self._dump_subject(first_astrological_subject),
+                "second_subject": self._dump_subject(second_astrological_subject),
             },
-            "aspects": [aspect.model_dump() for aspect in aspects],
+            "aspects": _dump_aspects(aspects),
         }
 
-    def get_current_time_data(self) -> Dict[str, Any]:
+    def _get_current_time_subject(self) -> AstrologicalSubject:
         """
-        Retrieve astrological data for the current moment.
+        Get the AstrologicalSubject for the current UTC minute.
         
         Returns:
-            Dictionary with status and birth data for current UTC time
+            AstrologicalSubject instance for current UTC time
             
         Raises:
             Exception: If unable to get current time or calculate chart
         """
-        logger.debug("Getting current astrological data")
-        
         try:
-            utc_datetime = get_time_from_google()
-            datetime_dict = {
-                "year": utc_datetime.year,  # type: ignore
-                "month": utc_datetime.month,  # type: ignore
-                "day": utc_datetime.day,  # type: ignore
-                "hour": utc_datetime.hour,  # type: ignore
-                "minute": utc_datetime.minute,  # type: ignore
-                "second": utc_datetime.second,  # type: ignore
-            }
+            utc_datetime = _CLOCK.utcnow()
         except Exception as e:
             logger.error(f"Failed to get current time: {e}")
             raise
         
-        logger.debug(f"Current UTC time: {datetime_dict}")
+        logger.debug(f"Current UTC time: {utc_datetime}")
         
         try:
-            today_subject = AstrologicalSubject(
-                city="GMT",
-                nation="UK",
-                lat=51.477928,
-                lng=-0.001545,
-                tz_str="GMT",
-                year=datetime_dict["year"],
-                month=datetime_dict["month"],
-                day=datetime_dict["day"],
-                hour=datetime_dict["hour"],
-                minute=datetime_dict["minute"],
-                online=False,
-            )
-            
-            return {
-                "status": "OK",
-                "data": today_subject.model().model_dump(),
-            }
+            return _current_time_subject(_minute_bucket(utc_datetime))
         except Exception as e:
             logger.error(f"Failed to calculate current time chart: {e}")
             raise
 
+    def get_current_time_data(self) -> Dict[str, Any]:
+        """
+        Retrieve astrological data for the current moment.
+        
+        Returns:
+            Dictionary with status and birth data for current UTC time
+            
+        Raises:
+            Exception: If unable to get current time or calculate chart
+        """
+        logger.debug("Getting current astrological data")
+        
+        return {
+            "status": "OK",
+            "data": self._dump_subject(self._get_current_time_subject()),
+        }
+
+    def get_current_time_data_json(self) -> bytes:
+        """
+        Same as get_current_time_data, serialized to JSON bytes.
+        The bytes are encoded once per UTC minute.
+        
+        Returns:
+            The get_current_time_data response as JSON bytes
+            
+        Raises:
+            Exception: If unable to get current time or calculate chart
+        """
+        logger.debug("Getting current astrological data as JSON")
+        
+        return self._dump_data_json(self._get_current_time_subject())
+
@@ -0,0 +1,66 @@
+"""
+ChartSVG - KerykeionChartSVG with the theme and template files loaded once.
+"""
+
+from pathlib import Path
+from string import Template
+from typing import Dict, Optional, Union, get_args
+
+import kerykeion.charts.kerykeion_chart_svg as kerykeion_chart_svg
+from kerykeion import KerykeionChartSVG
+from kerykeion.kr_types.kr_literals import KerykeionChartTheme
+from kerykeion.kr_types.chart_types import ChartTemplateDictionary
+from scour.scour import scourString
+
+_CHARTS_DIR = Path(kerykeion_chart_svg.__file__).parent
+
+
+def _read_file(path: Path) -> str:
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        return f.read()
+
+
+def _finish_template(template: str, minify: bool) -> str:
+    """
+    Apply the same post-processing as KerykeionChartSVG to a substituted template.
+    """
+    if minify:
+        return scourString(template).replace('"', "'").replace("\n", "").replace("\t", "").replace("    ", "").replace("  ", "")
+    return template.replace('"', "'")
+
+
+# Theme CSS and parsed SVG templates, read once at import instead of on every chart
+_THEME_CSS: Dict[str, str] = {
+    theme: _read_file(_CHARTS_DIR / "themes" / f"{theme}.css") for theme in get_args(KerykeionChartTheme)
+}
+_CHART_TEMPLATE = Template(_read_file(_CHARTS_DIR / "templates" / "chart.xml"))
+_WHEEL_ONLY_TEMPLATE = Template(_read_file(_CHARTS_DIR / "templates" / "wheel_only.xml"))
+
+
+class ChartSVG(KerykeionChartSVG):
+    """
+    KerykeionChartSVG that reads the themes and templates from memory and builds
+    the template dictionary once per chart, so rendering the full chart and the
+    wheel from the same instance shares it.
+    Output with remove_css_variables falls back to KerykeionChartSVG.
+    """
+
+    _template_dictionary: Optional[ChartTemplateDictionary] = None
+
+    def set_up_theme(self, theme: Union[KerykeionChartTheme, None] = None) -> None:
+        self.color_style_tag = _THEME_CSS[theme] if theme is not None else ""
+
+    def _get_template_dictionary(self) -> ChartTemplateDictionary:
+        if self._template_dictionary is None:
+            self._template_dictionary = self._create_template_dictionary()
+        return self._template_dictionary
+
+    def makeTemplate(self, minify: bool = False, remove_css_variables=False) -> str:
+        if remove_css_variables:
+            return super().makeTemplate(minify, remove_css_variables)
+        return _finish_template(_CHART_TEMPLATE.substitute(self._get_template_dictionary()), minify)
+
+    def makeWheelOnlyTemplate(self, minify: bool = False, remove_css_variables=False):
+        if remove_css_variables:
+            return super().makeWheelOnlyTemplate(minify, remove_css_variables)
+        return _finish_template(_WHEEL_ONLY_TEMPLATE.substitute(self._get_template_dictionary()), minify)
@@ -0,0 +1,91 @@
+"""
+Faster drop-in for kerykeion.utilities.get_kerykeion_point_from_degree.
+"""
+
+import importlib
+import inspect
+import logging
+from typing import Union
+
+import kerykeion.utilities as kerykeion_utilities
+from kerykeion.kr_types import KerykeionPointModel, KerykeionException, ZodiacSignModel
+from kerykeion.kr_types.kr_literals import PointType, Planet, Houses, AxialCusps
+
+logger = logging.getLogger(__name__)
+
+# Kerykeion modules that import get_kerykeion_point_from_degree by name
+_PATCHED_MODULES = ("kerykeion.astrological_subject", "kerykeion.composite_subject_factory")
+
+# Kerykeion validates these twelve models again for every point it creates
+_ZODIAC_SIGNS = (
+    ZodiacSignModel(sign="Ari", quality="Cardinal", element="Fire", emoji="♈️", sign_num=0),
+    ZodiacSignModel(sign="Tau", quality="Fixed", element="Earth", emoji="♉️", sign_num=1),
+    ZodiacSignModel(sign="Gem", quality="Mutable", element="Air", emoji="♊️", sign_num=2),
+    ZodiacSignModel(sign="Can", quality="Cardinal", element="Water", emoji="♋️", sign_num=3),
+    ZodiacSignModel(sign="Leo", quality="Fixed", element="Fire", emoji="♌️", sign_num=4),
+    ZodiacSignModel(sign="Vir", quality="Mutable", element="Earth", emoji="♍️", sign_num=5),
+    ZodiacSignModel(sign="Lib", quality="Cardinal", element="Air", emoji="♎️", sign_num=6),
+    ZodiacSignModel(sign="Sco", quality="Fixed", element="Water", emoji="♏️", sign_num=7),
+    ZodiacSignModel(sign="Sag", quality="Mutable", element="Fire", emoji="♐️", sign_num=8),
+    ZodiacSignModel(sign="Cap", quality="Cardinal", element="Earth", emoji="♑️", sign_num=9),
+    ZodiacSignModel(sign="Aqu", quality="Fixed", element="Air", emoji="♒️", sign_num=10),
+    ZodiacSignModel(sign="Pis", quality="Mutable", element="Water", emoji="♓️", sign_num=11),
+)
+
+
+def get_kerykeion_point_from_degree(
+    degree: Union[int, float], name: Union[Planet, Houses, AxialCusps], point_type: PointType
+) -> KerykeionPointModel:
+    """
+    Same as kerykeion.utilities.get_kerykeion_point_from_degree, with the zodiac signs
+    built once instead of on every call.
+
+    Raises:
+        KerykeionException: If the degree is not within the valid range (0-360).
+    """
+    if degree < 0 or degree >= 360:
+        raise KerykeionException(f"Error in calculating positions! Degrees: {degree}")
+
+    zodiac_sign = _ZODIAC_SIGNS[int(degree // 30)]
+
+    return KerykeionPointModel(
+        name=name,
+        quality=zodiac_sign.quality,
+        element=zodiac_sign.element,
+        sign=zodiac_sign.sign,
+        sign_num=zodiac_sign.sign_num,
+        position=degree % 30,
+        abs_pos=degree,
+        emoji=zodiac_sign.emoji,
+        point_type=point_type,
+    )
+
+
+def install() -> bool:
+    """
+    Opt in to make AstrologicalSubject and CompositeSubjectFactory use get_kerykeion_point_from_degree.
+    This replaces the function in those Kerykeion modules for the whole process.
+    Nothing is patched if the installed Kerykeion does not match the expected layout and signature.
+
+    Returns:
+        True if the function was installed, False if Kerykeion was left unchanged
+    """
+    original = getattr(kerykeion_utilities, "get_kerykeion_point_from_degree", None)
+    if original is None or inspect.signature(original).parameters.keys() != inspect.signature(get_kerykeion_point_from_degree).parameters.keys():
+        logger.warning("Unexpected kerykeion.utilities.get_kerykeion_point_from_degree, keeping Kerykeion's implementation")
+        return False
+
+    modules = []
+    for module_name in _PATCHED_MODULES:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            module = None
+        if module is None or getattr(module, "get_kerykeion_point_from_degree", None) not in (original, get_kerykeion_point_from_degree):
+            logger.warning(f"Unexpected {module_name} layout, keeping Kerykeion's get_kerykeion_point_from_degree")
+            return False
+        modules.append(module)
+
+    for module in modules:
+        module.get_kerykeion_point_from_degree = get_kerykeion_point_from_degree  # type: ignore
+    return True
@@ -3,6 +3,9 @@ Utility functions for astrology library.
 """
 
 from .get_time_from_google import get_time_from_google
+from .get_ntp_time import get_ntp_time
+from .dump_json import dump_json
+from .time_sync import OffsetClock
 
-__all__ = ["get_time_from_google"]
+__all__ = ["get_time_from_google", "get_ntp_time", "dump_json", "OffsetClock"]
 
@@ -0,0 +1,25 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    orjson = None  # type: ignore
+
+
+def dump_json(response: Any) -> bytes:
+    """
+    Serialize an AstrologyCalculator response to compact UTF-8 JSON.
+
+    Uses orjson when it is installed, which encodes the nested subject and aspect
+    dicts in C, and falls back to the standard json module otherwise.
+
+    Args:
+        response: The dict returned by an AstrologyCalculator method
+
+    Returns:
+        The JSON document as bytes, ready to be sent with the application/json media type
+    """
+    if orjson is not None:
+        return orjson.dumps(response)
+    return json.dumps(response, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,52 @@
+import socket
+import struct
+from datetime import datetime, timezone
+
+# Seconds between the NTP epoch (1900-01-01) and the Unix epoch (1970-01-01)
+NTP_TO_UNIX_SECONDS = 2208988800
+
+
+def get_ntp_time(server: str = "time.google.com", timeout: float = 5) -> datetime:
+    """
+    Gets the current time from an NTP server.
+
+    Args:
+        server: The NTP server to use (default: time.google.com)
+        timeout: The connection timeout in seconds (default: 5)
+
+    Returns:
+        A datetime object in UTC timezone representing the current time
+
+    Raises:
+        TimeoutError: If the NTP server does not answer in time
+        ValueError: If the reply is not the time of a synchronised server
+    """
+    NTP_PORT = 123
+    # RFC 4330 format - Mode: 3 (client), Version: 3
+    NTP_PACKET = b'\x1b' + 47 * b'\0'
+
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.settimeout(timeout)
+            sock.sendto(NTP_PACKET, (server, NTP_PORT))
+            data, _ = sock.recvfrom(48)
+    except socket.timeout as e:
+        raise TimeoutError("Timeout during NTP request") from e
+
+    if len(data) < 48:
+        raise ValueError(f"Invalid NTP reply from {server}: {len(data)} bytes")
+
+    # RFC 4330: leap indicator 3 means the server clock is not synchronised,
+    # stratum 0 is a Kiss-o'-Death reply and carries no time
+    leap_indicator = data[0] >> 6
+    stratum = data[1]
+    if leap_indicator == 3 or stratum == 0 or stratum > 15:
+        raise ValueError(f"Unsynchronised NTP reply from {server}: leap indicator {leap_indicator}, stratum {stratum}")
+
+    # RFC 4330: bytes 40-47 contain the Transmit Timestamp (seconds and fraction since 1900-01-01)
+    ntp_seconds, ntp_fraction = struct.unpack('!II', data[40:48])
+    if ntp_seconds == 0 and ntp_fraction == 0:
+        raise ValueError(f"Invalid NTP reply from {server}: no transmit timestamp")
+    unix_time = ntp_seconds - NTP_TO_UNIX_SECONDS + ntp_fraction / 2**32
+
+    return datetime.fromtimestamp(unix_time, tz=timezone.utc)
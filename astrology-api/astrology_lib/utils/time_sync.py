@@ -0,0 +1,95 @@
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from .get_ntp_time import get_ntp_time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_NTP_SERVER = "time.google.com"
+DEFAULT_SYNC_INTERVAL_SECONDS = 600
+# A larger offset means a wrong reply rather than a wrong local clock
+DEFAULT_MAX_OFFSET_SECONDS = 24 * 3600
+
+
+class OffsetClock:
+    """
+    UTC clock that corrects the local clock with the offset measured against an NTP server.
+
+    The offset is measured once on first use, then refreshed in a background thread every
+    sync_interval seconds, so reading the time never waits on the network afterwards.
+    If the NTP server cannot be reached, or measures an offset above max_offset,
+    the last known offset (initially 0) is kept.
+
+    Args:
+        server: The NTP server to use
+        sync_interval: Seconds between two offset measurements
+        timeout: NTP request timeout in seconds
+        max_offset: Largest offset in seconds accepted from the NTP server
+    """
+
+    def __init__(
+        self,
+        server: str = DEFAULT_NTP_SERVER,
+        sync_interval: float = DEFAULT_SYNC_INTERVAL_SECONDS,
+        timeout: float = 5,
+        max_offset: float = DEFAULT_MAX_OFFSET_SECONDS,
+    ):
+        self.server = server
+        self.sync_interval = sync_interval
+        self.timeout = timeout
+        self.max_offset = max_offset
+        self.offset_seconds = 0.0
+
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def sync(self) -> None:
+        """
+        Measure the offset between the NTP server and the local clock.
+        """
+        try:
+            sent_at = time.time()
+            ntp_time = get_ntp_time(self.server, self.timeout)
+            received_at = time.time()
+        except Exception as e:
+            logger.warning(f"NTP sync with {self.server} failed, keeping offset {self.offset_seconds:.3f}s: {e}")
+            return
+
+        # Assume the server read its clock halfway through the round trip
+        offset_seconds = ntp_time.timestamp() - (sent_at + received_at) / 2
+        if abs(offset_seconds) > self.max_offset:
+            logger.warning(f"NTP offset from {self.server} of {offset_seconds:.3f}s is not plausible, keeping offset {self.offset_seconds:.3f}s")
+            return
+
+        self.offset_seconds = offset_seconds
+        logger.debug(f"NTP offset from {self.server}: {self.offset_seconds:.3f}s")
+
+    def start(self) -> None:
+        """
+        Measure the offset and start the background thread that keeps it up to date.
+        Does nothing if the thread is already running.
+        """
+        with self._lock:
+            if self._thread is not None:
+                return
+
+            self.sync()
+            self._thread = threading.Thread(target=self._run, name="astrology-ntp-sync", daemon=True)
+            self._thread.start()
+
+    def utcnow(self) -> datetime:
+        """
+        Return the current UTC time as a naive datetime, corrected with the NTP offset.
+        """
+        if self._thread is None:
+            self.start()
+
+        return datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(seconds=self.offset_seconds)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.sync_interval)
+            self.sync()
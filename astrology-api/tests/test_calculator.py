@@ -0,0 +1,444 @@
+"""
+    Tests for the AstrologyCalculator caches, chart options and GeoNames handling.
+"""
+
+from sys import path
+from pathlib import Path
+
+path.append(str(Path(__file__).parent.parent))
+
+import asyncio
+import gc
+import json
+from datetime import datetime
+
+import pytest
+import kerykeion.astrological_subject as kerykeion_astrological_subject
+from kerykeion import AstrologicalSubject
+
+from astrology_lib import AstrologyCalculator, SubjectModel, TransitSubjectModel
+from astrology_lib import calculator as calculator_module
+from astrology_lib.calculator import GEONAMES_ERROR_MESSAGE, NATAL_ASPECTS_CACHE_SIZE
+
+
+def make_subject(**overrides) -> SubjectModel:
+    fields = {
+        "name": "Test Subject",
+        "year": 1946,
+        "month": 6,
+        "day": 16,
+        "hour": 10,
+        "minute": 10,
+        "longitude": 12.4963655,
+        "latitude": 41.9027835,
+        "city": "Roma",
+        "nation": "IT",
+        "timezone": "Europe/Rome",
+    }
+    fields.update(overrides)
+    return SubjectModel(**fields)
+
+
+FIRST_SUBJECT = make_subject()
+SECOND_SUBJECT = make_subject(name="Test Second", year=1990, month=6, day=15, hour=14, minute=30, longitude=-74.006, latitude=40.7128, city="New York", nation="US", timezone="America/New_York")
+TRANSIT_SUBJECT = TransitSubjectModel(year=2024, month=1, day=1, hour=0, minute=0, longitude=0, latitude=51.4825766, city="London", nation="GB", timezone="Europe/London")
+
+
+def clear_caches():
+    calculator_module._build_subject.cache_clear()
+    calculator_module._GEO_CACHE.clear()
+    calculator_module._current_time_subject.cache_clear()
+    calculator_module._CHART_CACHE.clear()
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    clear_caches()
+    yield
+    clear_caches()
+
+
+@pytest.fixture
+def calculator():
+    return AstrologyCalculator()
+
+
+RESPONSES = [
+    ("get_birth_data", lambda c: c.get_birth_data(FIRST_SUBJECT)),
+    ("get_natal_aspects", lambda c: c.get_natal_aspects(FIRST_SUBJECT)),
+    ("calculate_birth_chart", lambda c: c.calculate_birth_chart(FIRST_SUBJECT)),
+    ("calculate_birth_chart_with_aspects", lambda c: c.calculate_birth_chart_with_aspects(FIRST_SUBJECT)),
+    ("calculate_synastry_chart", lambda c: c.calculate_synastry_chart(FIRST_SUBJECT, SECOND_SUBJECT)),
+    ("get_synastry_aspects", lambda c: c.get_synastry_aspects(FIRST_SUBJECT, SECOND_SUBJECT)),
+    ("calculate_transit_chart", lambda c: c.calculate_transit_chart(FIRST_SUBJECT, TRANSIT_SUBJECT)),
+    ("get_transit_aspects", lambda c: c.get_transit_aspects(FIRST_SUBJECT, TRANSIT_SUBJECT)),
+    ("calculate_relationship_score", lambda c: c.calculate_relationship_score(FIRST_SUBJECT, SECOND_SUBJECT)),
+    ("calculate_composite_chart", lambda c: c.calculate_composite_chart(FIRST_SUBJECT, SECOND_SUBJECT)),
+    ("get_composite_aspects", lambda c: c.get_composite_aspects(FIRST_SUBJECT, SECOND_SUBJECT)),
+]
+
+
+@pytest.mark.parametrize("name, call", RESPONSES, ids=[name for name, _ in RESPONSES])
+def test_cached_response_equals_uncached(calculator, name, call):
+    """Test if a response served from the caches is the one computed from scratch"""
+
+    uncached = call(calculator)
+    cached = call(calculator)
+
+    clear_caches()
+    recomputed = call(AstrologyCalculator())
+
+    assert cached == uncached
+    assert recomputed == uncached
+
+
+def test_identical_subjects_are_built_once(calculator):
+    """Test if identical subjects share one AstrologicalSubject"""
+
+    astrological_subject = calculator._create_astrological_subject(FIRST_SUBJECT)
+
+    assert calculator._create_astrological_subject(make_subject()) is astrological_subject
+    assert calculator._create_astrological_subject(make_subject(minute=11)) is not astrological_subject
+
+
+def _mutate(value):
+    """Replace every nested value of a response in place"""
+
+    if isinstance(value, dict):
+        for key in list(value):
+            if isinstance(value[key], (dict, list)):
+                _mutate(value[key])
+            else:
+                value[key] = "HACKED"
+    elif isinstance(value, list):
+        for item in value:
+            _mutate(item)
+        value.clear()
+
+
+@pytest.mark.parametrize("name, call", RESPONSES, ids=[name for name, _ in RESPONSES])
+def test_mutating_a_response_does_not_change_the_next_one(calculator, name, call):
+    """Test if a caller changing a returned response does not affect later cache hits"""
+
+    expected = json.loads(json.dumps(call(calculator)))
+
+    _mutate(call(calculator))
+
+    assert call(calculator) == expected
+
+
+def test_get_birth_data_nested_mutation(calculator):
+    """Test if nested changes to the birth data are not shared"""
+
+    response = calculator.get_birth_data(FIRST_SUBJECT)
+    response["data"]["name"] = "HACKED"
+    response["data"]["sun"]["sign"] = "HACKED"
+
+    assert calculator.get_birth_data(FIRST_SUBJECT)["data"]["name"] == "Test Subject"
+    assert calculator.calculate_birth_chart(FIRST_SUBJECT)["data"]["sun"]["sign"] != "HACKED"
+
+
+class FakeFetchGeonames:
+    """
+    Stands in for kerykeion's FetchGeonames and counts the lookups.
+    """
+
+    calls = []
+
+    def __init__(self, city_name, country_code, username="", cache_expire_after_days=None):
+        self.city_name = city_name
+        self.username = username
+        FakeFetchGeonames.calls.append((city_name, country_code, username))
+
+    def get_serialized_data(self):
+        if self.username != "valid" or self.city_name != "Roma":
+            return {}
+        return {"countryCode": "IT", "timezonestr": "Europe/Rome", "lat": "41.9027835", "lng": "12.4963655"}
+
+
+@pytest.fixture
+def fake_geonames(monkeypatch):
+    FakeFetchGeonames.calls = []
+    monkeypatch.setattr(kerykeion_astrological_subject, "FetchGeonames", FakeFetchGeonames)
+    return FakeFetchGeonames
+
+
+def make_geonames_subject(**overrides) -> SubjectModel:
+    return SubjectModel(
+        **{
+            "name": "Test GeoNames",
+            "year": 1946,
+            "month": 6,
+            "day": 16,
+            "hour": 10,
+            "minute": 10,
+            "city": "Roma",
+            "nation": "IT",
+            "geonames_username": "valid",
+            **overrides,
+        }
+    )
+
+
+@pytest.fixture
+def pool_submits(monkeypatch):
+    """Count the subject builds sent to the subject pool"""
+
+    submits = []
+    submit = calculator_module._SUBJECT_POOL.submit
+
+    def counting_submit(fn, *args, **kwargs):
+        submits.append(fn)
+        return submit(fn, *args, **kwargs)
+
+    monkeypatch.setattr(calculator_module._SUBJECT_POOL, "submit", counting_submit)
+    return submits
+
+
+def test_offline_pair_is_built_inline(calculator, pool_submits):
+    """Test if subjects without a GeoNames lookup are not sent to the pool"""
+
+    calculator.get_synastry_aspects(FIRST_SUBJECT, SECOND_SUBJECT)
+    calculator.get_transit_aspects(FIRST_SUBJECT, TRANSIT_SUBJECT)
+
+    assert pool_submits == []
+
+
+def test_geonames_pair_is_built_on_the_pool(calculator, fake_geonames, pool_submits):
+    """Test if a pair with a pending GeoNames lookup is built on the pool"""
+
+    response = calculator.get_synastry_aspects(make_geonames_subject(), SECOND_SUBJECT)
+
+    assert len(pool_submits) == 2
+    assert fake_geonames.calls == [("Roma", "IT", "valid")]
+    assert response["data"]["first_subject"]["tz_str"] == "Europe/Rome"
+
+
+def test_geonames_lookup_error(calculator, fake_geonames):
+    """Test if a failed lookup raises the GeoNames error"""
+
+    with pytest.raises(ValueError) as error:
+        calculator.get_birth_data(make_geonames_subject(city="Nowhere"))
+    assert str(error.value) == GEONAMES_ERROR_MESSAGE
+
+    assert ("Nowhere", "IT") not in calculator_module._GEO_CACHE
+
+
+def test_geonames_location_is_cached(calculator, fake_geonames):
+    """Test if a city is only looked up once, and later subjects are built from the cached location"""
+
+    first = calculator.get_birth_data(make_geonames_subject())
+    second = calculator.get_birth_data(make_geonames_subject(name="Test GeoNames Again", hour=11))
+
+    assert fake_geonames.calls == [("Roma", "IT", "valid")]
+    assert (first["data"]["lat"], first["data"]["lng"], first["data"]["tz_str"]) == (41.9027835, 12.4963655, "Europe/Rome")
+    assert (second["data"]["lat"], second["data"]["lng"], second["data"]["tz_str"]) == (41.9027835, 12.4963655, "Europe/Rome")
+    assert calculator_module._GEO_CACHE[("Roma", "IT")] == ("IT", 41.9027835, 12.4963655, "Europe/Rome")
+
+
+def test_cached_location_pair_is_built_inline(calculator, fake_geonames, pool_submits):
+    """Test if a pair whose location is already cached is not sent to the pool"""
+
+    calculator.get_birth_data(make_geonames_subject())
+    calculator.get_synastry_aspects(make_geonames_subject(name="Test GeoNames Again"), SECOND_SUBJECT)
+
+    assert pool_submits == []
+    assert len(fake_geonames.calls) == 1
+
+
+def test_birth_chart_with_aspects(calculator):
+    """Test if the combined endpoint matches the birth chart and natal aspects endpoints"""
+
+    response = calculator.calculate_birth_chart_with_aspects(FIRST_SUBJECT)
+    birth_chart = calculator.calculate_birth_chart(FIRST_SUBJECT)
+    natal_aspects = calculator.get_natal_aspects(FIRST_SUBJECT)
+
+    assert list(response) == ["status", "chart", "data", "aspects"]
+    assert response["chart"] == birth_chart["chart"]
+    assert response["data"] == natal_aspects["data"]
+    assert response["aspects"] == natal_aspects["aspects"]
+
+
+def test_dump_aspects_matches_model_dump(calculator):
+    """Test if the aspects are serialized as model_dump does"""
+
+    astrological_subject = calculator._create_astrological_subject(FIRST_SUBJECT)
+    aspects = calculator_module.NatalAspects(astrological_subject).relevant_aspects
+
+    assert calculator_module._dump_aspects(aspects) == [aspect.model_dump() for aspect in aspects]
+
+
+def test_natal_aspects_memo_is_bounded(calculator):
+    """Test if client controlled orbs cannot grow the aspects memo of a subject"""
+
+    for index in range(NATAL_ASPECTS_CACHE_SIZE * 4):
+        calculator.get_natal_aspects(FIRST_SUBJECT, active_aspects=[{"name": "conjunction", "orb": 1 + index / 100}])
+
+    astrological_subject = calculator._create_astrological_subject(FIRST_SUBJECT)
+    assert len(astrological_subject._cached_natal_aspects) == NATAL_ASPECTS_CACHE_SIZE
+
+
+def test_resolve_geonames(calculator):
+    """Test if resolve_geonames fills the location cache with a caller owned client"""
+
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        if request.url.params["username"] != "valid":
+            return httpx.Response(200, json={"status": {"message": "user does not exist.", "value": 10}})
+        return httpx.Response(200, json={"geonames": [{"countryCode": "IT", "lat": "41.9027835", "lng": "12.4963655", "timezone": {"timeZoneId": "Europe/Rome"}}]})
+
+    async def resolve(subject):
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await calculator.resolve_geonames(subject, client=client)
+
+    assert asyncio.run(resolve(make_geonames_subject())) == ("IT", 41.9027835, 12.4963655, "Europe/Rome")
+    assert calculator_module._GEO_CACHE[("Roma", "IT")] == ("IT", 41.9027835, 12.4963655, "Europe/Rome")
+
+    with pytest.raises(ValueError) as error:
+        asyncio.run(resolve(make_geonames_subject(city="Milano", geonames_username="invalid")))
+    assert str(error.value) == GEONAMES_ERROR_MESSAGE
+
+
+def test_resolve_geonames_transport_error(calculator):
+    """Test if a transport error is not reported as a GeoNames username error"""
+
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    async def resolve():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await calculator.resolve_geonames(make_geonames_subject(), client=client)
+
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(resolve())
+
+
+def test_geonames_client_per_event_loop():
+    """Test if each event loop gets its own shared client"""
+
+    pytest.importorskip("httpx")
+
+    async def get_clients():
+        return calculator_module._get_geonames_client(), calculator_module._get_geonames_client()
+
+    first_loop_clients = asyncio.run(get_clients())
+    second_loop_clients = asyncio.run(get_clients())
+
+    assert first_loop_clients[0] is first_loop_clients[1]
+    assert second_loop_clients[0] is not first_loop_clients[0]
+
+
+def test_render_options(calculator):
+    """Test the keys returned for each render option"""
+
+    full = calculator.calculate_birth_chart(FIRST_SUBJECT)
+    wheel = calculator.calculate_birth_chart(FIRST_SUBJECT, wheel_only=True)
+    both = calculator.calculate_birth_chart(FIRST_SUBJECT, render="both")
+
+    assert list(full) == ["status", "chart", "data", "aspects"]
+    assert list(both) == ["status", "chart", "wheel_chart", "data", "aspects"]
+    assert both["chart"] == full["chart"]
+    assert both["wheel_chart"] == wheel["chart"]
+    assert calculator.calculate_birth_chart(FIRST_SUBJECT, render="wheel")["chart"] == wheel["chart"]
+    assert calculator.calculate_synastry_chart(FIRST_SUBJECT, SECOND_SUBJECT, render="both")["wheel_chart"] == calculator.calculate_synastry_chart(FIRST_SUBJECT, SECOND_SUBJECT, wheel_only=True)["chart"]
+
+
+def test_composite_subject_is_freed_with_its_subjects():
+    """Test if a pair shares one composite subject, which does not outlive the subjects"""
+
+    first_subject = AstrologicalSubject("Test First", 1946, 6, 16, 10, 10, lng=12.4963655, lat=41.9027835, tz_str="Europe/Rome", city="Roma", nation="IT", online=False)
+    second_subject = AstrologicalSubject("Test Second", 1990, 6, 15, 14, 30, lng=-74.006, lat=40.7128, tz_str="America/New_York", city="New York", nation="US", online=False)
+
+    composite_subject = calculator_module._build_composite_subject(first_subject, second_subject)
+    assert calculator_module._build_composite_subject(first_subject, second_subject) is composite_subject
+
+    del second_subject
+    gc.collect()
+    assert len(first_subject._cached_composites) == 0
+
+
+def test_embed_chart_false_and_get_chart_svg(calculator):
+    """Test if charts returned by id can be fetched from the chart store"""
+
+    embedded = calculator.calculate_birth_chart(FIRST_SUBJECT, render="both")
+    by_id = calculator.calculate_birth_chart(FIRST_SUBJECT, render="both", embed_chart=False)
+
+    assert list(by_id) == ["status", "chart_id", "wheel_chart_id", "data", "aspects"]
+    assert by_id["data"] == embedded["data"]
+    assert by_id["aspects"] == embedded["aspects"]
+    assert calculator.get_chart_svg(by_id["chart_id"]) == embedded["chart"].encode("utf-8")
+    assert calculator.get_chart_svg(by_id["wheel_chart_id"]) == embedded["wheel_chart"].encode("utf-8")
+    assert list(calculator.calculate_birth_chart_with_aspects(FIRST_SUBJECT, embed_chart=False)) == ["status", "chart_id", "data", "aspects"]
+
+    with pytest.raises(ValueError):
+        calculator.get_chart_svg("unknown")
+
+
+def test_repeated_chart_keeps_one_stored_copy(calculator):
+    """Test if requesting the same chart by id again reuses its stored SVG"""
+
+    first = calculator.calculate_birth_chart(FIRST_SUBJECT, render="both", embed_chart=False)
+    second = calculator.calculate_birth_chart(FIRST_SUBJECT, render="both", embed_chart=False)
+    other = calculator.calculate_synastry_chart(FIRST_SUBJECT, SECOND_SUBJECT, embed_chart=False)
+
+    assert (second["chart_id"], second["wheel_chart_id"]) == (first["chart_id"], first["wheel_chart_id"])
+    assert other["chart_id"] not in (first["chart_id"], first["wheel_chart_id"])
+    assert len(calculator._svg_store) == 3
+
+
+def test_chart_store_is_bounded(calculator, monkeypatch):
+    """Test if the chart store keeps the last SVG_STORE_SIZE charts"""
+
+    monkeypatch.setattr(calculator_module, "SVG_STORE_SIZE", 2)
+
+    chart_ids = [calculator._store_svg(f"<svg>{index}</svg>") for index in range(3)]
+
+    assert calculator.get_chart_svg(chart_ids[2]) == b"<svg>2</svg>"
+    assert len(calculator._svg_store) == 2
+    with pytest.raises(ValueError):
+        calculator.get_chart_svg(chart_ids[0])
+    assert calculator._store_svg("<svg>0</svg>") not in chart_ids
+
+
+def test_identical_charts_are_rendered_once(calculator, monkeypatch):
+    """Test if an identical chart request reuses the rendered SVGs"""
+
+    renders = []
+    chart_svg = calculator_module.ChartSVG
+
+    def counting_chart_svg(*args, **kwargs):
+        renders.append(args)
+        return chart_svg(*args, **kwargs)
+
+    monkeypatch.setattr(calculator_module, "ChartSVG", counting_chart_svg)
+
+    first = calculator.calculate_synastry_chart(FIRST_SUBJECT, SECOND_SUBJECT)
+    second = calculator.calculate_synastry_chart(FIRST_SUBJECT, SECOND_SUBJECT)
+    calculator.calculate_synastry_chart(FIRST_SUBJECT, SECOND_SUBJECT, theme="dark")
+
+    assert first == second
+    assert len(renders) == 2
+
+
+def test_transit_subject_is_cached(calculator):
+    """Test if the transit subject is built once and follows the settings of the natal subject"""
+
+    natal_subject = make_subject(zodiac_type="Sidereal", sidereal_mode="LAHIRI")
+    transit_subject = calculator._create_transit_subject(natal_subject, TRANSIT_SUBJECT)
+
+    assert calculator._create_transit_subject(natal_subject, TRANSIT_SUBJECT) is transit_subject
+    assert (transit_subject.name, transit_subject.zodiac_type, transit_subject.sidereal_mode) == ("Transit", "Sidereal", "LAHIRI")
+
+
+def test_json_responses(calculator, monkeypatch):
+    """Test if the JSON bytes responses encode the dict responses"""
+
+    monkeypatch.setattr(calculator_module._CLOCK, "utcnow", lambda: datetime(2024, 1, 1, 12, 30, 15))
+
+    assert json.loads(calculator.get_birth_data_json(FIRST_SUBJECT)) == calculator.get_birth_data(FIRST_SUBJECT)
+    assert calculator.get_birth_data_json(FIRST_SUBJECT) is calculator.get_birth_data_json(FIRST_SUBJECT)
+    assert json.loads(calculator.get_current_time_data_json()) == calculator.get_current_time_data()
+    assert calculator.get_current_time_data()["data"]["minute"] == 30
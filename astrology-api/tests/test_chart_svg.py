@@ -0,0 +1,57 @@
+"""
+    Tests that ChartSVG renders exactly what KerykeionChartSVG renders.
+"""
+
+from sys import path
+from pathlib import Path
+
+path.append(str(Path(__file__).parent.parent))
+
+import pytest
+from kerykeion import AstrologicalSubject, KerykeionChartSVG, CompositeSubjectFactory
+
+from astrology_lib.chart_svg import ChartSVG
+
+FIRST_SUBJECT = AstrologicalSubject("Test First", 1946, 6, 16, 10, 10, lng=12.4963655, lat=41.9027835, tz_str="Europe/Rome", city="Roma", nation="IT", online=False)
+SECOND_SUBJECT = AstrologicalSubject("Test Second", 1990, 6, 15, 14, 30, lng=-74.006, lat=40.7128, tz_str="America/New_York", city="New York", nation="US", online=False)
+
+
+@pytest.mark.parametrize(
+    "chart_kwargs",
+    [
+        {},
+        {"theme": "dark", "chart_language": "FR"},
+        {"theme": "light", "second_obj": SECOND_SUBJECT, "chart_type": "Synastry"},
+        {"theme": "dark-high-contrast", "second_obj": SECOND_SUBJECT, "chart_type": "Transit", "chart_language": "IT"},
+        {"theme": None},
+    ],
+)
+@pytest.mark.parametrize("minify", [True, False])
+def test_chart_svg_matches_kerykeion(chart_kwargs, minify):
+    """Test if the full chart and the wheel are byte for byte the ones of KerykeionChartSVG"""
+
+    chart = ChartSVG(FIRST_SUBJECT, **chart_kwargs)
+    kerykeion_chart = KerykeionChartSVG(FIRST_SUBJECT, **chart_kwargs)
+
+    assert chart.makeTemplate(minify=minify) == kerykeion_chart.makeTemplate(minify=minify)
+    assert chart.makeWheelOnlyTemplate(minify=minify) == kerykeion_chart.makeWheelOnlyTemplate(minify=minify)
+
+
+def test_composite_chart_svg_matches_kerykeion():
+    """Test if the composite chart is byte for byte the one of KerykeionChartSVG"""
+
+    composite_subject = CompositeSubjectFactory(FIRST_SUBJECT, SECOND_SUBJECT).get_midpoint_composite_subject_model()
+
+    chart = ChartSVG(composite_subject, chart_type="Composite")
+    kerykeion_chart = KerykeionChartSVG(composite_subject, chart_type="Composite")
+
+    assert chart.makeTemplate(minify=True) == kerykeion_chart.makeTemplate(minify=True)
+
+
+def test_chart_svg_renders_twice_the_same():
+    """Test if rendering again from the same instance, with the shared template dictionary, gives the same SVG"""
+
+    chart = ChartSVG(FIRST_SUBJECT)
+
+    assert chart.makeTemplate(minify=True) == chart.makeTemplate(minify=True)
+    assert chart.makeWheelOnlyTemplate() == KerykeionChartSVG(FIRST_SUBJECT).makeWheelOnlyTemplate()
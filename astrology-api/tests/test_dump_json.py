@@ -0,0 +1,35 @@
+"""
+    Tests for dump_json with and without orjson.
+"""
+
+from sys import path, modules
+from pathlib import Path
+
+path.append(str(Path(__file__).parent.parent))
+
+import json
+
+import pytest
+
+from astrology_lib import AstrologyCalculator, SubjectModel
+from astrology_lib.utils import dump_json
+
+# astrology_lib.utils.dump_json is the function, the module is looked up by name
+dump_json_module = modules["astrology_lib.utils.dump_json"]
+
+RESPONSE = AstrologyCalculator().calculate_birth_chart_with_aspects(
+    SubjectModel(name="Test Ünicode ♈", year=1946, month=6, day=16, hour=10, minute=10, longitude=12.4963655, latitude=41.9027835, city="Roma", nation="IT", timezone="Europe/Rome")
+)
+
+
+def test_dump_json_without_orjson(monkeypatch):
+    """Test if the standard library fallback encodes the same document as orjson"""
+
+    pytest.importorskip("orjson")
+
+    with_orjson = dump_json(RESPONSE)
+    monkeypatch.setattr(dump_json_module, "orjson", None)
+    without_orjson = dump_json(RESPONSE)
+
+    assert isinstance(without_orjson, bytes)
+    assert json.loads(with_orjson) == json.loads(without_orjson) == json.loads(json.dumps(RESPONSE))
@@ -0,0 +1,86 @@
+"""
+    Tests for the faster get_kerykeion_point_from_degree and its opt-in install.
+"""
+
+from sys import path
+from pathlib import Path
+
+path.append(str(Path(__file__).parent.parent))
+
+import importlib
+
+import pytest
+import kerykeion.utilities as kerykeion_utilities
+from kerykeion import AstrologicalSubject, CompositeSubjectFactory
+
+from astrology_lib import kerykeion_point
+from astrology_lib.kerykeion_point import get_kerykeion_point_from_degree
+
+PATCHED_MODULES = [importlib.import_module(module_name) for module_name in kerykeion_point._PATCHED_MODULES]
+
+
+def build_subjects():
+    first_subject = AstrologicalSubject("Test First", 1946, 6, 16, 10, 10, lng=12.4963655, lat=41.9027835, tz_str="Europe/Rome", city="Roma", nation="IT", online=False)
+    second_subject = AstrologicalSubject("Test Second", 1990, 6, 15, 14, 30, lng=-74.006, lat=40.7128, tz_str="America/New_York", city="New York", nation="US", online=False)
+    composite_subject = CompositeSubjectFactory(first_subject, second_subject).get_midpoint_composite_subject_model()
+    return first_subject.model().model_dump(), composite_subject.model_dump()
+
+
+@pytest.fixture
+def restore_kerykeion(monkeypatch):
+    """Put Kerykeion's functions back after the test, whatever install did"""
+
+    monkeypatch.setattr(kerykeion_utilities, "get_kerykeion_point_from_degree", kerykeion_utilities.get_kerykeion_point_from_degree)
+    for module in PATCHED_MODULES:
+        monkeypatch.setattr(module, "get_kerykeion_point_from_degree", module.get_kerykeion_point_from_degree)
+    return monkeypatch
+
+
+@pytest.mark.parametrize("point_type", ["Planet", "House"])
+def test_kerykeion_point_matches_kerykeion(point_type):
+    """Test if the precomputed zodiac signs give the points of kerykeion.utilities"""
+
+    for degree in [0, 0.5, 29.999, 30, 123.456, 180, 359.999]:
+        assert get_kerykeion_point_from_degree(degree, "Sun", point_type) == kerykeion_utilities.get_kerykeion_point_from_degree(degree, "Sun", point_type)
+
+    with pytest.raises(Exception):
+        get_kerykeion_point_from_degree(360, "Sun", point_type)
+
+
+def test_install(restore_kerykeion):
+    """Test if install patches both Kerykeion modules without changing the subjects they build"""
+
+    unpatched = build_subjects()
+
+    assert kerykeion_point.install() is True
+    for module in PATCHED_MODULES:
+        assert module.get_kerykeion_point_from_degree is get_kerykeion_point_from_degree
+
+    assert build_subjects() == unpatched
+    assert kerykeion_point.install() is True
+
+
+def test_install_signature_mismatch(restore_kerykeion):
+    """Test if a Kerykeion function with another signature is left in place"""
+
+    def get_kerykeion_point_from_degree(degree, name, point_type, extra=None):
+        pass
+
+    restore_kerykeion.setattr(kerykeion_utilities, "get_kerykeion_point_from_degree", get_kerykeion_point_from_degree)
+    originals = [module.get_kerykeion_point_from_degree for module in PATCHED_MODULES]
+
+    assert kerykeion_point.install() is False
+    assert [module.get_kerykeion_point_from_degree for module in PATCHED_MODULES] == originals
+
+
+def test_install_layout_mismatch(restore_kerykeion):
+    """Test if no module is patched when one of them does not use Kerykeion's function"""
+
+    def other_point_function(degree, name, point_type):
+        pass
+
+    restore_kerykeion.setattr(PATCHED_MODULES[-1], "get_kerykeion_point_from_degree", other_point_function)
+
+    assert kerykeion_point.install() is False
+    assert PATCHED_MODULES[0].get_kerykeion_point_from_degree is kerykeion_utilities.get_kerykeion_point_from_degree
+    assert PATCHED_MODULES[-1].get_kerykeion_point_from_degree is other_point_function
@@ -0,0 +1,144 @@
+"""
+    Tests for the NTP reply checks and the OffsetClock.
+"""
+
+from sys import path, modules
+from pathlib import Path
+
+path.append(str(Path(__file__).parent.parent))
+
+import struct
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from astrology_lib.utils import OffsetClock, get_ntp_time
+from astrology_lib.utils.get_ntp_time import NTP_TO_UNIX_SECONDS
+
+# astrology_lib.utils.get_ntp_time is the function, the modules are looked up by name
+get_ntp_time_module = modules["astrology_lib.utils.get_ntp_time"]
+time_sync_module = modules["astrology_lib.utils.time_sync"]
+
+NTP_NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def make_reply(leap_indicator=0, stratum=2, transmit=NTP_NOW) -> bytes:
+    ntp_seconds = int(transmit.timestamp()) + NTP_TO_UNIX_SECONDS if transmit is not None else 0
+    return bytes([leap_indicator << 6 | 3 << 3 | 4, stratum]) + 38 * b"\0" + struct.pack("!II", ntp_seconds, 0)
+
+
+@pytest.fixture
+def ntp_reply(monkeypatch):
+    """Answer the NTP requests with the reply set on the fixture"""
+
+    class FakeSocket:
+        reply = make_reply()
+
+        def __init__(self, *args):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+        def settimeout(self, timeout):
+            pass
+
+        def sendto(self, packet, address):
+            pass
+
+        def recvfrom(self, size):
+            return FakeSocket.reply[:size], ("127.0.0.1", 123)
+
+    monkeypatch.setattr(get_ntp_time_module.socket, "socket", FakeSocket)
+    return FakeSocket
+
+
+def test_get_ntp_time(ntp_reply):
+    """Test if the transmit timestamp of a valid reply is returned"""
+
+    assert get_ntp_time("ntp.test") == NTP_NOW
+
+
+@pytest.mark.parametrize(
+    "reply",
+    [
+        make_reply(stratum=0),
+        make_reply(leap_indicator=3),
+        make_reply(transmit=None),
+        make_reply()[:40],
+    ],
+    ids=["kiss-o-death", "unsynchronised", "no-transmit-timestamp", "short"],
+)
+def test_get_ntp_time_rejects_invalid_replies(ntp_reply, reply):
+    """Test if replies without a usable time raise instead of returning a time in 1900"""
+
+    ntp_reply.reply = reply
+
+    with pytest.raises(ValueError):
+        get_ntp_time("ntp.test")
+
+
+@pytest.fixture
+def ntp_offset(monkeypatch):
+    """Make get_ntp_time answer with the local time shifted by the offset set on the fixture"""
+
+    class NTPOffset:
+        seconds = 0.0
+        error = None
+        calls = 0
+
+    def fake_get_ntp_time(server, timeout):
+        NTPOffset.calls += 1
+        if NTPOffset.error is not None:
+            raise NTPOffset.error
+        return datetime.now(timezone.utc) + timedelta(seconds=NTPOffset.seconds)
+
+    monkeypatch.setattr(time_sync_module, "get_ntp_time", fake_get_ntp_time)
+    return NTPOffset
+
+
+def test_sync_measures_the_offset(ntp_offset):
+    """Test if the offset is measured and applied to the local time"""
+
+    ntp_offset.seconds = 120
+    clock = OffsetClock()
+    clock.sync()
+
+    assert clock.offset_seconds == pytest.approx(120, abs=1)
+    assert clock.utcnow() - datetime.now(timezone.utc).replace(tzinfo=None) == pytest.approx(timedelta(seconds=120), abs=timedelta(seconds=1))
+
+
+def test_sync_failure_keeps_the_offset(ntp_offset):
+    """Test if a failed or implausible measurement keeps the last known offset"""
+
+    ntp_offset.seconds = 30
+    clock = OffsetClock(max_offset=3600)
+    clock.sync()
+
+    ntp_offset.error = TimeoutError("Timeout during NTP request")
+    clock.sync()
+    assert clock.offset_seconds == pytest.approx(30, abs=1)
+
+    ntp_offset.error = None
+    ntp_offset.seconds = -3 * 10**9
+    clock.sync()
+    assert clock.offset_seconds == pytest.approx(30, abs=1)
+
+
+def test_start_is_lazy(ntp_offset):
+    """Test if the clock only syncs on first use, and only starts one thread"""
+
+    clock = OffsetClock(sync_interval=3600)
+    assert ntp_offset.calls == 0
+
+    clock.utcnow()
+    thread = clock._thread
+    clock.utcnow()
+    clock.start()
+
+    assert ntp_offset.calls == 1
+    assert thread is not None and thread.is_alive() and thread.daemon
+    assert clock._thread is thread